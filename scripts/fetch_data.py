@@ -2,6 +2,7 @@
 """Main script to fetch stock data and check for crossover signals."""
 
 import argparse
+import concurrent.futures
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -13,18 +14,78 @@ from tqqq.config import HISTORY_DAYS, TICKERS
 from tqqq.database import (
     get_connection,
     get_last_date,
+    get_last_signal_date,
     save_prices,
     get_price_count,
     get_date_range,
     get_new_signals,
     save_signals,
 )
-from tqqq.fetcher import fetch_prices, fetch_all_tickers_parallel
+from tqqq.fetcher import fetch_prices, fetch_all_tickers_parallel, create_http_session
 from tqqq.signals import detect_crossovers
 from tqqq.notifications import trigger_all_notifications
 from tqqq.fear_greed import fetch_fear_greed
 
 
+def process_ticker(ticker, df, timestamp, no_notify):
+    """Save prices, detect signals, and notify for a single ticker.
+
+    Opens its own connection so tickers can be processed concurrently
+    (SQLite connections must stay thread-local).
+    """
+    lines = [f"\n{'='*60}\nProcessing {ticker}\n{'='*60}",
+             f"[{timestamp}] Fetched {len(df)} days of data"]
+
+    conn = get_connection()
+
+    # Save to database (committed together with this ticker's signals)
+    if len(df) > 0:
+        rows = save_prices(conn, ticker, df, commit=False)
+        lines.append(f"[{timestamp}] Saved {rows} rows to database")
+    else:
+        lines.append(f"[{timestamp}] No new data to save")
+
+    # Show stats
+    count = get_price_count(conn, ticker)
+    min_date, max_date = get_date_range(conn, ticker)
+    lines.append(f"[{timestamp}] Total rows for {ticker}: {count}")
+    if min_date and max_date:
+        lines.append(f"[{timestamp}] Date range: {min_date} to {max_date}")
+
+    # Detect and process crossover signals
+    lines.append(f"[{timestamp}] Checking for crossover signals...")
+    # Only extract signals newer than the last saved one; get_new_signals
+    # then dedups a handful of candidates instead of the full history
+    last_signal_date = get_last_signal_date(conn, ticker)
+    all_signals = detect_crossovers(conn, ticker, since_date=last_signal_date)
+    new_signals = get_new_signals(conn, ticker, all_signals)
+
+    if new_signals:
+        lines.append(f"[{timestamp}] Found {len(new_signals)} new crossover signal(s)!")
+        save_signals(conn, ticker, new_signals, commit=False)
+        if no_notify:
+            lines.append(f"[{timestamp}] Skipping notifications (--no-notify flag set)")
+    else:
+        lines.append(f"[{timestamp}] No new crossover signals")
+
+    # One fsync per ticker instead of one per save call; commit before
+    # notifications so a failing channel can't lose saved state
+    conn.commit()
+    # Keep planner statistics fresh; this is the one regular write path,
+    # so the read-only report scripts don't have to. analysis_limit caps
+    # how many rows any implied ANALYZE will scan.
+    conn.execute("PRAGMA analysis_limit=1000")
+    conn.execute("PRAGMA optimize")
+    conn.close()
+
+    # Single print per ticker so concurrent workers don't interleave output
+    print("\n".join(lines))
+
+    if new_signals and not no_notify:
+        for signal in new_signals:
+            trigger_all_notifications(signal, timestamp)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Fetch stock data for configured tickers")
     parser.add_argument(
@@ -67,16 +128,33 @@ def main():
         if args.full:
             all_data = fetch_all_tickers_parallel(tickers_to_process, days=HISTORY_DAYS)
         else:
-            # For incremental, we need to determine start dates per ticker first
+            # For incremental, determine start dates per ticker first
+            # (single-threaded - SQLite), then fetch concurrently so total
+            # wall time is the slowest fetch rather than the sum of all.
+            tasks = []
             for ticker in tickers_to_process:
                 last_date = get_last_date(conn, ticker)
                 if last_date:
                     start_date = datetime.strptime(last_date, "%Y-%m-%d") + timedelta(days=1)
-                    all_data[ticker] = fetch_prices(ticker, start_date=start_date)
+                    tasks.append((ticker, {"start_date": start_date}))
                 else:
                     # No data exists, fetch full history
-                    if ticker not in all_data:
-                        all_data[ticker] = fetch_prices(ticker, days=HISTORY_DAYS)
+                    tasks.append((ticker, {"days": HISTORY_DAYS}))
+
+            # Share one pooled HTTP session so TLS setup is paid once
+            session = create_http_session()
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(tasks), 8)) as executor:
+                future_to_ticker = {
+                    executor.submit(fetch_prices, ticker, session=session, **kwargs): ticker
+                    for ticker, kwargs in tasks
+                }
+                for future in concurrent.futures.as_completed(future_to_ticker):
+                    ticker = future_to_ticker[future]
+                    try:
+                        all_data[ticker] = future.result()
+                    except Exception as e:
+                        print(f"Warning: Failed to fetch {ticker}: {e}")
     else:
         # Sequential processing
         for ticker in tickers_to_process:
@@ -94,41 +172,19 @@ def main():
                     print(f"[{timestamp}] No existing data, fetching full {HISTORY_DAYS} days...")
                     all_data[ticker] = fetch_prices(ticker, days=HISTORY_DAYS)
 
-    # Process each ticker's data
-    for ticker, df in all_data.items():
-        print(f"\n{'='*60}\nProcessing {ticker}\n{'='*60}")
-        print(f"[{timestamp}] Fetched {len(df)} days of data")
+    conn.close()
 
-        # Save to database
-        if len(df) > 0:
-            rows = save_prices(conn, ticker, df)
-            print(f"[{timestamp}] Saved {rows} rows to database")
-        else:
-            print(f"[{timestamp}] No new data to save")
-
-        # Show stats
-        count = get_price_count(conn, ticker)
-        min_date, max_date = get_date_range(conn, ticker)
-        print(f"[{timestamp}] Total rows for {ticker}: {count}")
-        if min_date and max_date:
-            print(f"[{timestamp}] Date range: {min_date} to {max_date}")
-
-        # Detect and process crossover signals
-        print(f"[{timestamp}] Checking for crossover signals...")
-        all_signals = detect_crossovers(conn, ticker)
-        new_signals = get_new_signals(conn, ticker, all_signals)
-
-        if new_signals:
-            print(f"[{timestamp}] Found {len(new_signals)} new crossover signal(s)!")
-            save_signals(conn, ticker, new_signals)
-
-            if args.no_notify:
-                print(f"[{timestamp}] Skipping notifications (--no-notify flag set)")
-            else:
-                for signal in new_signals:
-                    trigger_all_notifications(signal, timestamp)
-        else:
-            print(f"[{timestamp}] No new crossover signals")
+    # Process each ticker's data concurrently; each worker opens its own
+    # connection, and the network-bound notification step no longer
+    # serializes across tickers
+    if all_data:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(all_data))) as executor:
+            futures = [
+                executor.submit(process_ticker, ticker, df, timestamp, args.no_notify)
+                for ticker, df in all_data.items()
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
 
     # Fear & Greed Index (once for all tickers)
     print(f"\n{'='*60}")
@@ -136,7 +192,6 @@ def main():
     if fg:
         print(f"[{timestamp}] Fear & Greed Index: {fg['score']} ({fg['rating']})")
 
-    conn.close()
     print(f"[{timestamp}] Done!")
 
 
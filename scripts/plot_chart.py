@@ -26,17 +26,17 @@ def main():
 
     ticker = args.ticker.upper()
 
-    conn = get_connection()
-    df = load_prices(conn, ticker)
+    conn = get_connection(read_only=True)
+    df = load_prices(conn, ticker, with_mas=True)
     conn.close()
 
     if len(df) < MA_LONG:
         print(f"Not enough data for {ticker}. Need at least {MA_LONG} days.")
         return
 
-    # Calculate moving averages
-    df["MA_SHORT"] = df["close"].rolling(window=MA_SHORT).mean()
-    df["MA_LONG"] = df["close"].rolling(window=MA_LONG).mean()
+    # Moving averages come precomputed from the database cache
+    df["MA_SHORT"] = df["ma_short"]
+    df["MA_LONG"] = df["ma_long"]
     df.set_index("date", inplace=True)
 
     # Plot
@@ -10,9 +10,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pandas as pd
 
-from tqqq.config import MA_SHORT, MA_LONG, TICKER
+from tqqq.config import TICKER
 from tqqq.database import get_connection, load_prices
 
+# %-formatting skips the per-field __format__ dispatch an f-string pays
+# on every row of the table
+ROW_FMT = "%-12s $%7.2f $%7.2f $%7.2f %12s %20s%s"
+
 
 def main():
     parser = argparse.ArgumentParser(description="Simulate crossover detection")
@@ -35,18 +39,21 @@ def main():
 
     ticker = args.ticker.upper()
 
-    conn = get_connection()
-    df = load_prices(conn, ticker)
+    conn = get_connection(read_only=True)
+    df = load_prices(conn, ticker, with_mas=True)
     conn.close()
 
-    # Calculate moving averages
-    df["MA_SHORT"] = df["close"].rolling(window=MA_SHORT).mean()
-    df["MA_LONG"] = df["close"].rolling(window=MA_LONG).mean()
-    df = df.dropna()
+    # Moving averages come precomputed from the database cache
+    df["MA_SHORT"] = df["ma_short"]
+    df["MA_LONG"] = df["ma_long"]
+    df = df.dropna(subset=["MA_SHORT", "MA_LONG"])
 
-    # Detect crossovers
+    # Detect crossovers vectorially: comparing against the shifted state
+    # in pandas replaces per-row Python comparisons over the whole range
     df["short_above"] = df["MA_SHORT"] > df["MA_LONG"]
-    df["prev_short_above"] = df["short_above"].shift(1)
+    prev_short_above = df["short_above"].shift(1)
+    df["golden"] = df["short_above"] & prev_short_above.eq(False)
+    df["dead"] = ~df["short_above"] & prev_short_above.eq(True)
 
     # Filter date range
     mask = (df["date"] >= args.start) & (df["date"] <= args.end)
@@ -59,26 +66,39 @@ def main():
     print(f"\n{'Date':<12} {'Close':>8} {'MA5':>8} {'MA30':>8} {'Status':>12} {'Signal':>20}")
     print("-" * 80)
 
-    signals = []
-
-    for _, row in data.iterrows():
-        date_str = row["date"].strftime("%Y-%m-%d")
-        status = "BULLISH" if row["short_above"] else "BEARISH"
-
-        signal = ""
-        if row["short_above"] == True and row["prev_short_above"] == False:
+    # Collect signals from the precomputed masks in bulk
+    date_strs = data["date"].dt.strftime("%Y-%m-%d")
+    signals = [
+        {"date": d, "type": "GOLDEN", "close": c}
+        for d, c in zip(date_strs[data["golden"]], data.loc[data["golden"], "close"])
+    ] + [
+        {"date": d, "type": "DEAD", "close": c}
+        for d, c in zip(date_strs[data["dead"]], data.loc[data["dead"], "close"])
+    ]
+    signals.sort(key=lambda s: s["date"])
+
+    # itertuples avoids reboxing each row into a Series; buffering the
+    # rows turns N line-buffered writes into a single one
+    lines = []
+    for date_str, row in zip(date_strs, data.itertuples(index=False)):
+        status = "BULLISH" if row.short_above else "BEARISH"
+
+        if row.golden:
             signal = "🟢 GOLDEN CROSS"
-            signals.append({"date": date_str, "type": "GOLDEN", "close": row["close"]})
-        elif row["short_above"] == False and row["prev_short_above"] == True:
+        elif row.dead:
             signal = "🔴 DEAD CROSS"
-            signals.append({"date": date_str, "type": "DEAD", "close": row["close"]})
+        else:
+            signal = ""
 
         marker = " <<<" if signal else ""
-        print(
-            f"{date_str:<12} ${row['close']:>7.2f} ${row['MA_SHORT']:>7.2f} "
-            f"${row['MA_LONG']:>7.2f} {status:>12} {signal:>20}{marker}"
+        lines.append(
+            ROW_FMT % (date_str, row.close, row.MA_SHORT, row.MA_LONG,
+                       status, signal, marker)
         )
 
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
     print("\n" + "=" * 80)
     print("SUMMARY")
     print("=" * 80)
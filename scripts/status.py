@@ -2,63 +2,75 @@
 """Show current status and recent signals for tracked tickers."""
 
 import argparse
+import concurrent.futures
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tqqq.database import get_connection, get_price_count, get_date_range, get_all_tickers
-from tqqq.signals import get_current_status
+from tqqq.database import get_connection, get_ticker_stats
+from tqqq.signals import get_current_status_bulk
 from tqqq.fear_greed import fetch_fear_greed, format_fear_greed_message
 
 
-def show_ticker_status(conn, ticker: str):
-    """Show status for a specific ticker."""
-    print("=" * 50)
-    print(f"{ticker} TRADING BOT STATUS")
-    print("=" * 50)
+def load_recent_signals(conn, limit: int = 5) -> dict:
+    """Load the most recent signals for every ticker in one query.
 
-    # Database stats
-    count = get_price_count(conn, ticker)
-    min_date, max_date = get_date_range(conn, ticker)
+    Returns a dict mapping ticker to a list of (date, signal_type,
+    close_price) tuples, newest first.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT ticker, date, signal_type, close_price
+        FROM (
+            SELECT ticker, date, signal_type, close_price,
+                   ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY date DESC) AS rn
+            FROM crossover_signals
+        )
+        WHERE rn <= ?
+        ORDER BY ticker, date DESC
+    """, (limit,))
+
+    recent = {}
+    for ticker, date, signal_type, close in cursor.fetchall():
+        recent.setdefault(ticker, []).append((date, signal_type, close))
+    return recent
+
+
+def show_ticker_status(ticker: str, stats: dict, status: dict, recent: list,
+                       out: list):
+    """Append a ticker's status report to the output buffer."""
+    out.append("=" * 50)
+    out.append(f"{ticker} TRADING BOT STATUS")
+    out.append("=" * 50)
 
-    print(f"\nDatabase: {count} price records")
-    if min_date and max_date:
-        print(f"Date Range: {min_date} to {max_date}")
+    # Database stats
+    count = stats["record_count"] if stats else 0
+    out.append(f"\nDatabase: {count} price records")
+    if stats and stats["first_date"] and stats["last_date"]:
+        out.append(f"Date Range: {stats['first_date']} to {stats['last_date']}")
 
     # Current MA status
-    status = get_current_status(conn, ticker)
-
     if status.get("status") == "INSUFFICIENT_DATA":
-        print("\nNot enough data to calculate moving averages")
+        out.append("\nNot enough data to calculate moving averages")
     else:
         emoji = "🟢" if status["status"] == "BULLISH" else "🔴"
-        print(f"\n{emoji} Current Status: {status['status']}")
-        print(f"  Date:  {status['date']}")
-        print(f"  Close: ${status['close']:.2f}")
-        print(f"  MA5:   ${status['ma_short']:.2f}")
-        print(f"  MA30:  ${status['ma_long']:.2f}")
-        print(f"  Gap:   ${status['gap']:.2f}")
+        out.append(f"\n{emoji} Current Status: {status['status']}")
+        out.append(f"  Date:  {status['date']}")
+        out.append(f"  Close: ${status['close']:.2f}")
+        out.append(f"  MA5:   ${status['ma_short']:.2f}")
+        out.append(f"  MA30:  ${status['ma_long']:.2f}")
+        out.append(f"  Gap:   ${status['gap']:.2f}")
 
     # Recent signals
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT date, signal_type, close_price
-        FROM crossover_signals
-        WHERE ticker = ?
-        ORDER BY date DESC
-        LIMIT 5
-    """, (ticker,))
-    recent = cursor.fetchall()
-
     if recent:
-        print("\nRecent Signals:")
-        print("-" * 50)
+        out.append("\nRecent Signals:")
+        out.append("-" * 50)
         for date, signal_type, close in recent:
             emoji = "🟢" if signal_type == "GOLDEN_CROSS" else "🔴"
             name = "Golden Cross" if signal_type == "GOLDEN_CROSS" else "Dead Cross"
-            print(f"  {emoji} {date}: {name} @ ${close:.2f}")
+            out.append(f"  {emoji} {date}: {name} @ ${close:.2f}")
 
 
 def main():
@@ -69,35 +81,64 @@ def main():
     )
     args = parser.parse_args()
 
-    conn = get_connection()
+    # Kick off the Fear & Greed HTTP fetch now so the network round-trip
+    # overlaps with the database work below
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    fg_future = executor.submit(fetch_fear_greed)
+
+    conn = get_connection(read_only=True)
+
+    # Fetch everything up front in three grouped queries instead of
+    # four-plus round-trips per ticker
+    stats = get_ticker_stats(conn)
 
     # Determine which tickers to show
     if args.ticker:
         tickers = [args.ticker.upper()]
     else:
-        tickers = get_all_tickers(conn)
+        tickers = sorted(stats)
         if not tickers:
             print("No tickers found in database. Run fetch_data.py first.")
             conn.close()
+            executor.shutdown(wait=False)
             return
 
+    statuses = get_current_status_bulk(conn, tickers)
+    recent_signals = load_recent_signals(conn)
+
+    # Buffer the whole report and flush it in one write instead of a
+    # dozen-plus syscalls per ticker
+    out = []
+
     # Show status for each ticker
     for i, ticker in enumerate(tickers):
         if i > 0:
-            print("\n")  # Add spacing between tickers
-        show_ticker_status(conn, ticker)
+            out.append("\n")  # Add spacing between tickers
+        show_ticker_status(
+            ticker,
+            stats.get(ticker),
+            statuses[ticker],
+            recent_signals.get(ticker, []),
+            out,
+        )
 
     conn.close()
 
     # Fear & Greed Index (once for all tickers)
-    print("\n" + "=" * 50)
-    print("CNN FEAR & GREED INDEX")
-    print("=" * 50)
-    fg_data = fetch_fear_greed()
+    out.append("\n" + "=" * 50)
+    out.append("CNN FEAR & GREED INDEX")
+    out.append("=" * 50)
+    try:
+        fg_data = fg_future.result(timeout=5)
+    except Exception:
+        fg_data = None
+    executor.shutdown(wait=False)
     if fg_data:
-        print(f"\n{format_fear_greed_message(fg_data)}")
+        out.append(f"\n{format_fear_greed_message(fg_data)}")
     else:
-        print("\nUnable to fetch Fear & Greed Index")
+        out.append("\nUnable to fetch Fear & Greed Index")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -14,16 +15,35 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+from tqqq.database import get_connection
 
-    conn = sqlite3.connect(path)
+
+@pytest.fixture(scope="module")
+def shared_conn():
+    """Module-scoped in-memory connection with the schema created once.
+
+    Avoids hitting the real database file for tests that only need a
+    connection with the production schema.
+    """
+    conn = get_connection(":memory:")
+    yield conn
+    conn.close()
+
+
+def _bulk_insert(conn, sql, rows_iter):
+    """Insert rows through one executemany inside a single transaction.
+
+    Accepts any iterable, so callers can pass a generator and let
+    sqlite3 consume it in C without materializing a list of tuples.
+    """
+    with conn:
+        conn.executemany(sql, rows_iter)
+
+
+def _create_test_schema(conn):
+    """Create the multi-ticker schema on a test connection."""
     cursor = conn.cursor()
 
-    # Create tables with multi-ticker schema
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS tqqq_prices (
             ticker TEXT NOT NULL,
@@ -34,6 +54,8 @@ def temp_db():
             close REAL,
             adj_close REAL,
             volume INTEGER,
+            ma_short REAL,
+            ma_long REAL,
             PRIMARY KEY (ticker, date)
         )
     """)
@@ -54,27 +76,50 @@ def temp_db():
 
     conn.commit()
 
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary database file for testing."""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+
+    conn = sqlite3.connect(path)
+    # Throwaway database: skip journal and fsync overhead entirely
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    _create_test_schema(conn)
+
     yield conn, path
 
     conn.close()
     os.unlink(path)
 
 
-@pytest.fixture
-def sample_price_data():
-    """Generate sample price data for testing."""
+def _make_sample_price_data():
+    """Build the 40-row ascending-ramp OHLCV frame used by the fixtures."""
     dates = pd.date_range(start="2025-01-01", periods=40, freq="B")
+    # Vectorized ramps: one ndarray per column instead of boxing
+    # every float through a list comprehension
+    steps = np.arange(40, dtype=np.float64) * 0.5
     data = {
-        "Open": [50 + i * 0.5 for i in range(40)],
-        "High": [51 + i * 0.5 for i in range(40)],
-        "Low": [49 + i * 0.5 for i in range(40)],
-        "Close": [50 + i * 0.5 for i in range(40)],
-        "Volume": [1000000 + i * 10000 for i in range(40)],
+        "Open": 50 + steps,
+        "High": 51 + steps,
+        "Low": 49 + steps,
+        "Close": 50 + steps,
+        "Volume": 1000000 + np.arange(40) * 10000,
     }
     df = pd.DataFrame(data, index=dates)
     return df
 
 
+@pytest.fixture
+def sample_price_data():
+    """Generate sample price data for testing."""
+    return _make_sample_price_data()
+
+
 @pytest.fixture
 def sample_price_data_with_crossover():
     """Generate sample price data that creates a golden cross.
@@ -87,7 +132,7 @@ def sample_price_data_with_crossover():
     dates = pd.date_range(start="2025-01-01", periods=40, freq="B")
 
     # Decline for first 35 days, then rally
-    prices = (
+    prices = np.asarray(
         [80, 78, 76, 74, 72]  # Days 1-5
         + [70, 68, 66, 64, 62]  # Days 6-10
         + [60, 58, 56, 54, 52]  # Days 11-15
@@ -95,46 +140,64 @@ def sample_price_data_with_crossover():
         + [40, 39, 38, 37, 36]  # Days 21-25
         + [35, 34, 33, 32, 31]  # Days 26-30: MA30 starts here
         + [30, 29, 28, 27, 26]  # Days 31-35: continued decline
-        + [40, 55, 70, 85, 100]  # Days 36-40: sharp rally to cross
+        + [40, 55, 70, 85, 100],  # Days 36-40: sharp rally to cross
+        dtype=np.float64,
     )
 
     data = {
-        "Open": [float(p) for p in prices],
-        "High": [float(p + 1) for p in prices],
-        "Low": [float(p - 1) for p in prices],
-        "Close": [float(p) for p in prices],
+        "Open": prices,
+        "High": prices + 1,
+        "Low": prices - 1,
+        "Close": prices,
         "Volume": [1000000] * 40,
     }
     df = pd.DataFrame(data, index=dates)
     return df
 
 
-@pytest.fixture
-def populated_db(temp_db, sample_price_data):
-    """Create a database populated with sample data for TQQQ."""
-    conn, path = temp_db
-    cursor = conn.cursor()
+@pytest.fixture(scope="session")
+def _populated_template():
+    """In-memory template database built once with the TQQQ sample rows.
 
-    for date, row in sample_price_data.iterrows():
-        cursor.execute(
-            """
-            INSERT INTO tqqq_prices (ticker, date, open, high, low, close, adj_close, volume)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                "TQQQ",
-                date.strftime("%Y-%m-%d"),
-                row["Open"],
-                row["High"],
-                row["Low"],
-                row["Close"],
-                row["Close"],
-                int(row["Volume"]),
-            ),
-        )
+    Tests never touch this connection directly; populated_db clones it
+    via the backup API, so the schema DDL and the 40-row insert run once
+    per session instead of once per test.
+    """
+    conn = sqlite3.connect(":memory:")
+    _create_test_schema(conn)
+
+    sample = _make_sample_price_data()
+    # One executemany batches all rows through a single prepared
+    # statement; the generator keeps the DataFrame the sole owner of
+    # the data instead of materializing a second list of tuples
+    rows = (
+        ("TQQQ", date.strftime("%Y-%m-%d"), o, h, l, c, c, int(v))
+        for date, o, h, l, c, v in sample.itertuples(index=True, name=None)
+    )
+    _bulk_insert(
+        conn,
+        """
+        INSERT INTO tqqq_prices (ticker, date, open, high, low, close, adj_close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+        rows,
+    )
+    yield conn
+    conn.close()
 
-    conn.commit()
-    return conn, path
+
+@pytest.fixture
+def populated_db(_populated_template):
+    """Create a database populated with sample data for TQQQ.
+
+    Each test gets a fresh in-memory copy of the session template; the
+    page-level backup is far cheaper than re-creating and re-populating
+    a file database per test.
+    """
+    conn = sqlite3.connect(":memory:")
+    _populated_template.backup(conn)
+    yield conn, None
+    conn.close()
 
 
 @pytest.fixture
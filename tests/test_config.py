@@ -1,101 +1,84 @@
 """Tests for tqqq.config module."""
 
-import os
-from pathlib import Path
-
 import pytest
 
 
+@pytest.fixture(scope="class")
+def cfg():
+    """Hand the class the imported config module once.
+
+    One import + attribute access through a local instead of a
+    per-test `from tqqq.config import X` dance.
+    """
+    import tqqq.config
+
+    return tqqq.config
+
+
 class TestConfig:
     """Tests for configuration settings."""
 
-    def test_root_dir_exists(self):
+    def test_root_dir_exists(self, cfg):
         """Test that ROOT_DIR points to valid directory."""
-        from tqqq.config import ROOT_DIR
-
-        assert ROOT_DIR.exists()
-        assert ROOT_DIR.is_dir()
+        assert cfg.ROOT_DIR.exists()
+        assert cfg.ROOT_DIR.is_dir()
 
-    def test_data_dir_exists(self):
+    def test_data_dir_exists(self, cfg):
         """Test that DATA_DIR is created."""
-        from tqqq.config import DATA_DIR
+        assert cfg.DATA_DIR.exists()
+        assert cfg.DATA_DIR.is_dir()
 
-        assert DATA_DIR.exists()
-        assert DATA_DIR.is_dir()
-
-    def test_logs_dir_exists(self):
+    def test_logs_dir_exists(self, cfg):
         """Test that LOGS_DIR is created."""
-        from tqqq.config import LOGS_DIR
-
-        assert LOGS_DIR.exists()
-        assert LOGS_DIR.is_dir()
+        assert cfg.LOGS_DIR.exists()
+        assert cfg.LOGS_DIR.is_dir()
 
-    def test_db_path_in_data_dir(self):
+    def test_db_path_in_data_dir(self, cfg):
         """Test that DB_PATH is inside DATA_DIR."""
-        from tqqq.config import DB_PATH, DATA_DIR
-
-        assert DB_PATH.parent == DATA_DIR
-        assert DB_PATH.suffix == ".db"
+        assert cfg.DB_PATH.parent == cfg.DATA_DIR
+        assert cfg.DB_PATH.suffix == ".db"
 
-    def test_moving_average_settings(self):
+    def test_moving_average_settings(self, cfg):
         """Test moving average configuration values."""
-        from tqqq.config import MA_SHORT, MA_LONG
+        assert cfg.MA_SHORT == 5
+        assert cfg.MA_LONG == 30
+        assert cfg.MA_SHORT < cfg.MA_LONG
 
-        assert MA_SHORT == 5
-        assert MA_LONG == 30
-        assert MA_SHORT < MA_LONG
-
-    def test_ticker_setting(self):
+    def test_ticker_setting(self, cfg):
         """Test ticker symbol configuration."""
-        from tqqq.config import TICKER
-
-        assert TICKER == "TQQQ"
+        assert cfg.TICKER == "TQQQ"
 
-    def test_history_days_setting(self):
+    def test_history_days_setting(self, cfg):
         """Test history days configuration."""
-        from tqqq.config import HISTORY_DAYS
+        assert cfg.HISTORY_DAYS == 365
+        assert cfg.HISTORY_DAYS > 0
 
-        assert HISTORY_DAYS == 365
-        assert HISTORY_DAYS > 0
-
-    def test_smtp_settings(self):
+    def test_smtp_settings(self, cfg):
         """Test SMTP configuration values."""
-        from tqqq.config import SMTP_SERVER, SMTP_PORT
-
-        assert SMTP_SERVER == "smtp.gmail.com"
-        assert SMTP_PORT == 587
-
-    def test_email_disabled_by_default(self):
-        """Test that email is disabled by default."""
-        # Clear environment variable
-        original = os.environ.get("TQQQ_EMAIL_ENABLED")
-        os.environ.pop("TQQQ_EMAIL_ENABLED", None)
-
-        # Reimport to get fresh value
-        import importlib
-        import tqqq.config
+        assert cfg.SMTP_SERVER == "smtp.gmail.com"
+        assert cfg.SMTP_PORT == 587
 
-        importlib.reload(tqqq.config)
 
-        # Restore original
-        if original:
-            os.environ["TQQQ_EMAIL_ENABLED"] = original
+class TestConfigEnvironment:
+    """Tests that re-read environment-driven settings via _refresh."""
 
-    def test_email_enabled_from_env(self):
+    def test_email_disabled_by_default(self, cfg, monkeypatch):
+        """Test that email is disabled by default."""
+        monkeypatch.delenv("TQQQ_EMAIL_ENABLED", raising=False)
+        try:
+            # _refresh only re-reads os.environ — no module reload
+            cfg._refresh()
+            assert cfg.EMAIL_ENABLED is False
+        finally:
+            monkeypatch.undo()
+            cfg._refresh()
+
+    def test_email_enabled_from_env(self, cfg, monkeypatch):
         """Test that email can be enabled via environment."""
-        original = os.environ.get("TQQQ_EMAIL_ENABLED")
-        os.environ["TQQQ_EMAIL_ENABLED"] = "true"
-
-        import importlib
-        import tqqq.config
-
-        importlib.reload(tqqq.config)
-        assert tqqq.config.EMAIL_ENABLED is True
-
-        # Restore
-        if original:
-            os.environ["TQQQ_EMAIL_ENABLED"] = original
-        else:
-            os.environ.pop("TQQQ_EMAIL_ENABLED", None)
-
-        importlib.reload(tqqq.config)
+        monkeypatch.setenv("TQQQ_EMAIL_ENABLED", "true")
+        try:
+            cfg._refresh()
+            assert cfg.EMAIL_ENABLED is True
+        finally:
+            monkeypatch.undo()
+            cfg._refresh()
@@ -9,6 +9,7 @@ import pytest
 from tqqq.database import (
     get_connection,
     get_last_date,
+    get_last_signal_date,
     save_prices,
     load_prices,
     get_new_signals,
@@ -17,22 +18,20 @@ from tqqq.database import (
     get_date_range,
     get_all_tickers,
     get_ticker_stats,
+    refresh_moving_averages,
 )
 
 
 class TestGetConnection:
     """Tests for get_connection function."""
 
-    def test_returns_connection(self):
+    def test_returns_connection(self, shared_conn):
         """Test that get_connection returns a valid connection."""
-        conn = get_connection()
-        assert isinstance(conn, sqlite3.Connection)
-        conn.close()
+        assert isinstance(shared_conn, sqlite3.Connection)
 
-    def test_creates_tables(self):
+    def test_creates_tables(self, shared_conn):
         """Test that tables are created on connection."""
-        conn = get_connection()
-        cursor = conn.cursor()
+        cursor = shared_conn.cursor()
 
         # Check tqqq_prices table exists
         cursor.execute(
@@ -46,6 +45,16 @@ class TestGetConnection:
         )
         assert cursor.fetchone() is not None
 
+    def test_read_only_connection_rejects_writes(self):
+        """Test that a read_only connection cannot modify the database."""
+        # Ensure the database file and tables exist first
+        get_connection().close()
+
+        conn = get_connection(read_only=True)
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute(
+                "INSERT INTO tqqq_prices (ticker, date) VALUES ('TQQQ', '2025-01-01')"
+            )
         conn.close()
 
 
@@ -67,6 +76,24 @@ class TestGetLastDate:
         assert result == "2025-02-25"
 
 
+class TestGetLastSignalDate:
+    """Tests for get_last_signal_date function."""
+
+    def test_returns_none_for_empty_db(self, temp_db):
+        """Test returns None when no signals are saved."""
+        conn, _ = temp_db
+        result = get_last_signal_date(conn, "TQQQ")
+        assert result is None
+
+    def test_returns_max_signal_date(self, temp_db, sample_signal, sample_dead_cross_signal):
+        """Test returns the most recent signal date."""
+        conn, _ = temp_db
+        save_signals(conn, "TQQQ", [sample_signal, sample_dead_cross_signal])
+
+        result = get_last_signal_date(conn, "TQQQ")
+        assert result == "2025-01-20"
+
+
 class TestSavePrices:
     """Tests for save_prices function."""
 
@@ -83,9 +110,9 @@ class TestSavePrices:
         # Save initial data
         save_prices(conn, "TQQQ", sample_price_data)
 
-        # Modify and save again
-        modified_data = sample_price_data.copy()
-        modified_data["Close"] = modified_data["Close"] + 10
+        # Modify and save again; assign() allocates only the new Close
+        # array and shares the other column buffers under copy-on-write
+        modified_data = sample_price_data.assign(Close=sample_price_data["Close"] + 10)
         rows = save_prices(conn, "TQQQ", modified_data)
 
         assert rows == 40
@@ -103,6 +130,44 @@ class TestSavePrices:
         assert rows == len(sample_price_data)
 
 
+class TestRefreshMovingAverages:
+    """Tests for the cached ma_short/ma_long columns."""
+
+    def test_save_prices_populates_cache(self, temp_db, sample_price_data):
+        """Test that save_prices fills the cached MA columns."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data)
+
+        df = load_prices(conn, "TQQQ", with_mas=True)
+        expected_short = df["close"].rolling(window=5).mean()
+        expected_long = df["close"].rolling(window=30).mean()
+
+        pd.testing.assert_series_equal(df["ma_short"], expected_short, check_names=False)
+        pd.testing.assert_series_equal(df["ma_long"], expected_long, check_names=False)
+
+    def test_insufficient_history_stays_null(self, temp_db, sample_price_data):
+        """Test that rows without a full window keep NULL averages."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data)
+
+        df = load_prices(conn, "TQQQ", with_mas=True)
+        assert df["ma_short"].iloc[:4].isna().all()
+        assert df["ma_long"].iloc[:29].isna().all()
+        assert df["ma_long"].iloc[29:].notna().all()
+
+    def test_refresh_only_touches_given_ticker(self, temp_db, sample_price_data):
+        """Test that refreshing one ticker leaves others untouched."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data)
+
+        conn.execute("UPDATE tqqq_prices SET ma_short = NULL, ma_long = NULL")
+        refresh_moving_averages(conn, "YINN")
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM tqqq_prices WHERE ma_short IS NOT NULL")
+        assert cursor.fetchone()[0] == 0
+
+
 class TestLoadPrices:
     """Tests for load_prices function."""
 
@@ -128,8 +193,10 @@ class TestLoadPrices:
         conn, _ = populated_db
         df = load_prices(conn, "TQQQ")
 
-        dates = df["date"].tolist()
-        assert dates == sorted(dates)
+        # O(n) pairwise compare on the datetime64 array instead of
+        # sorting a boxed copy of the column
+        dates = df["date"].values
+        assert (dates[1:] >= dates[:-1]).all()
 
 
 class TestGetNewSignals:
@@ -1,160 +1,172 @@
 """Tests for tqqq.fetcher module."""
 
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
 from tqqq.fetcher import fetch_prices, fetch_all_tickers_parallel
 
+# Mock OHLCV frames built once at import instead of per test
+MOCK_DF_3 = pd.DataFrame(
+    {
+        "Open": [50, 51, 52],
+        "High": [51, 52, 53],
+        "Low": [49, 50, 51],
+        "Close": [50.5, 51.5, 52.5],
+        "Volume": [1000000, 1100000, 1200000],
+    },
+    index=pd.date_range(start="2025-01-01", periods=3),
+)
+
+MOCK_DF_1 = pd.DataFrame(
+    {
+        "Open": [50],
+        "High": [51],
+        "Low": [49],
+        "Close": [50.5],
+        "Volume": [1000000],
+    },
+    index=pd.date_range(start="2025-01-01", periods=1),
+)
+
+MOCK_DF_YINN = pd.DataFrame(
+    {"Open": [30], "High": [31], "Low": [29], "Close": [30.5], "Volume": [500000]},
+    index=pd.date_range(start="2025-01-01", periods=1),
+)
+
+
+@pytest.fixture(scope="module")
+def _ticker_patch():
+    """Install the yfinance patch once for the whole module."""
+    with patch("tqqq.fetcher.yf.Ticker") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_ticker(_ticker_patch):
+    """Hand each test the shared mock, reset to a clean state."""
+    _ticker_patch.reset_mock(return_value=True, side_effect=True)
+    return _ticker_patch
+
+
+@pytest.fixture(scope="module")
+def _download_patch():
+    """Install the batched-download patch once for the whole module."""
+    with patch("tqqq.fetcher.yf.download") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_download(_download_patch):
+    """Hand each test the shared download mock, reset to a clean state."""
+    _download_patch.reset_mock(return_value=True, side_effect=True)
+    return _download_patch
+
 
 class TestFetchPrices:
     """Tests for fetch_prices function."""
 
-    def test_fetch_with_days_parameter(self):
+    def test_fetch_with_days_parameter(self, mock_ticker):
         """Test fetching with days parameter."""
-        # Mock yfinance to avoid real API calls in tests
-        mock_df = pd.DataFrame(
-            {
-                "Open": [50, 51, 52],
-                "High": [51, 52, 53],
-                "Low": [49, 50, 51],
-                "Close": [50.5, 51.5, 52.5],
-                "Volume": [1000000, 1100000, 1200000],
-            },
-            index=pd.date_range(start="2025-01-01", periods=3),
-        )
+        mock_ticker.return_value.history.return_value = MOCK_DF_3
+        df = fetch_prices("TQQQ", days=7)
 
-        with patch("tqqq.fetcher.yf.Ticker") as mock_ticker:
-            mock_ticker.return_value.history.return_value = mock_df
-            df = fetch_prices("TQQQ", days=7)
+        assert isinstance(df, pd.DataFrame)
+        mock_ticker.return_value.history.assert_called_once()
 
-            assert isinstance(df, pd.DataFrame)
-            mock_ticker.return_value.history.assert_called_once()
-
-    def test_fetch_with_start_date(self):
+    def test_fetch_with_start_date(self, mock_ticker):
         """Test fetching with start_date parameter."""
-        mock_df = pd.DataFrame(
-            {
-                "Open": [50],
-                "High": [51],
-                "Low": [49],
-                "Close": [50.5],
-                "Volume": [1000000],
-            },
-            index=pd.date_range(start="2025-01-15", periods=1),
-        )
+        mock_ticker.return_value.history.return_value = MOCK_DF_1
+        start = datetime(2025, 1, 15)
+        df = fetch_prices("TQQQ", start_date=start)
 
-        with patch("tqqq.fetcher.yf.Ticker") as mock_ticker:
-            mock_ticker.return_value.history.return_value = mock_df
-            start = datetime(2025, 1, 15)
-            df = fetch_prices("TQQQ", start_date=start)
+        assert isinstance(df, pd.DataFrame)
+        call_kwargs = mock_ticker.return_value.history.call_args[1]
+        assert call_kwargs["start"] == start
 
-            assert isinstance(df, pd.DataFrame)
-            call_kwargs = mock_ticker.return_value.history.call_args[1]
-            assert call_kwargs["start"] == start
-
-    def test_returns_dataframe(self):
+    def test_returns_dataframe(self, mock_ticker):
         """Test that function returns a DataFrame."""
-        mock_df = pd.DataFrame(
-            {
-                "Open": [50],
-                "High": [51],
-                "Low": [49],
-                "Close": [50.5],
-                "Volume": [1000000],
-            },
-            index=pd.date_range(start="2025-01-01", periods=1),
-        )
-
-        with patch("tqqq.fetcher.yf.Ticker") as mock_ticker:
-            mock_ticker.return_value.history.return_value = mock_df
-            df = fetch_prices("TQQQ", days=1)
-            assert isinstance(df, pd.DataFrame)
+        mock_ticker.return_value.history.return_value = MOCK_DF_1
+        df = fetch_prices("TQQQ", days=1)
+        assert isinstance(df, pd.DataFrame)
 
-    def test_uses_correct_ticker(self):
+    def test_uses_correct_ticker(self, mock_ticker):
         """Test that correct ticker is used."""
-        with patch("tqqq.fetcher.yf.Ticker") as mock_ticker:
-            mock_ticker.return_value.history.return_value = pd.DataFrame()
-            fetch_prices("YINN", days=1)
-            mock_ticker.assert_called_with("YINN")
+        mock_ticker.return_value.history.return_value = pd.DataFrame()
+        fetch_prices("YINN", days=1)
+        mock_ticker.assert_called_with("YINN")
 
-    def test_default_days_parameter(self):
+    def test_default_days_parameter(self, mock_ticker):
         """Test default days parameter from config."""
         from tqqq.config import HISTORY_DAYS
 
-        with patch("tqqq.fetcher.yf.Ticker") as mock_ticker:
-            mock_ticker.return_value.history.return_value = pd.DataFrame()
-            fetch_prices("TQQQ")
+        mock_ticker.return_value.history.return_value = pd.DataFrame()
+        fetch_prices("TQQQ")
 
-            call_kwargs = mock_ticker.return_value.history.call_args[1]
-            start_date = call_kwargs["start"]
-            expected_start = datetime.now() - timedelta(days=HISTORY_DAYS)
+        call_kwargs = mock_ticker.return_value.history.call_args[1]
+        start_date = call_kwargs["start"]
+        expected_start = datetime.now() - timedelta(days=HISTORY_DAYS)
 
-            # Allow 1 day tolerance for test timing
-            assert abs((start_date - expected_start).days) <= 1
+        # Allow 1 day tolerance for test timing
+        assert abs((start_date - expected_start).days) <= 1
 
-    def test_empty_result_handling(self):
+    def test_empty_result_handling(self, mock_ticker):
         """Test handling of empty result from API."""
-        with patch("tqqq.fetcher.yf.Ticker") as mock_ticker:
-            mock_ticker.return_value.history.return_value = pd.DataFrame()
-            df = fetch_prices("TQQQ", days=1)
-            assert isinstance(df, pd.DataFrame)
-            assert len(df) == 0
+        mock_ticker.return_value.history.return_value = pd.DataFrame()
+        df = fetch_prices("TQQQ", days=1)
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 0
+
+
+def _batched_download_frame(per_ticker):
+    """Build the MultiIndex frame yf.download returns for a symbol list.
+
+    Tickers mapped to None get all-NaN columns, mirroring how yfinance
+    reports symbols that failed server-side.
+    """
+    index = pd.date_range(start="2025-01-01", periods=1)
+    pieces = {}
+    for ticker, df in per_ticker.items():
+        if df is None:
+            df = pd.DataFrame(
+                {col: [float("nan")] for col in MOCK_DF_1.columns}, index=index
+            )
+        pieces[ticker] = df
+    return pd.concat(pieces, axis=1)
 
 
 class TestFetchAllTickersParallel:
     """Tests for fetch_all_tickers_parallel function."""
 
-    def test_fetches_multiple_tickers(self):
-        """Test fetching multiple tickers in parallel."""
-        mock_df1 = pd.DataFrame(
-            {"Open": [50], "High": [51], "Low": [49], "Close": [50.5], "Volume": [1000000]},
-            index=pd.date_range(start="2025-01-01", periods=1),
-        )
-        mock_df2 = pd.DataFrame(
-            {"Open": [30], "High": [31], "Low": [29], "Close": [30.5], "Volume": [500000]},
-            index=pd.date_range(start="2025-01-01", periods=1),
+    def test_fetches_multiple_tickers(self, mock_download):
+        """Test fetching multiple tickers in one batched download."""
+        mock_download.return_value = _batched_download_frame(
+            {"TQQQ": MOCK_DF_1, "YINN": MOCK_DF_YINN}
         )
+        results = fetch_all_tickers_parallel(["TQQQ", "YINN"], days=7)
+
+        assert len(results) == 2
+        assert "TQQQ" in results
+        assert "YINN" in results
+        assert isinstance(results["TQQQ"], pd.DataFrame)
+        assert isinstance(results["YINN"], pd.DataFrame)
+        mock_download.assert_called_once()
 
-        with patch("tqqq.fetcher.yf.Ticker") as mock_ticker:
-            def side_effect(ticker):
-                mock = MagicMock()
-                if ticker == "TQQQ":
-                    mock.history.return_value = mock_df1
-                elif ticker == "YINN":
-                    mock.history.return_value = mock_df2
-                return mock
-
-            mock_ticker.side_effect = side_effect
-            results = fetch_all_tickers_parallel(["TQQQ", "YINN"], days=7)
-
-            assert len(results) == 2
-            assert "TQQQ" in results
-            assert "YINN" in results
-            assert isinstance(results["TQQQ"], pd.DataFrame)
-            assert isinstance(results["YINN"], pd.DataFrame)
-
-    def test_handles_failures_gracefully(self):
+    def test_handles_failures_gracefully(self, mock_download):
         """Test that failures don't stop other tickers from being fetched."""
-        mock_df = pd.DataFrame(
-            {"Open": [50], "High": [51], "Low": [49], "Close": [50.5], "Volume": [1000000]},
-            index=pd.date_range(start="2025-01-01", periods=1),
+        mock_download.return_value = _batched_download_frame(
+            {"TQQQ": MOCK_DF_1, "INVALID": None}
         )
+        results = fetch_all_tickers_parallel(["TQQQ", "INVALID"], days=7)
+
+        # Should have TQQQ but not INVALID
+        assert "TQQQ" in results
+        assert "INVALID" not in results
 
-        with patch("tqqq.fetcher.yf.Ticker") as mock_ticker:
-            def side_effect(ticker):
-                mock = MagicMock()
-                if ticker == "TQQQ":
-                    mock.history.return_value = mock_df
-                elif ticker == "INVALID":
-                    mock.history.side_effect = Exception("API Error")
-                return mock
-
-            mock_ticker.side_effect = side_effect
-            results = fetch_all_tickers_parallel(["TQQQ", "INVALID"], days=7)
-
-            # Should have TQQQ but not INVALID
-            assert "TQQQ" in results
-            assert "INVALID" not in results
+    def test_empty_download_returns_no_results(self, mock_download):
+        """Test that an empty batched response yields an empty dict."""
+        mock_download.return_value = pd.DataFrame()
+        results = fetch_all_tickers_parallel(["TQQQ"], days=7)
+        assert results == {}
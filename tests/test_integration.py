@@ -1,17 +1,17 @@
 """Integration tests using actual historical TQQQ data."""
 
+import re
 import sqlite3
-import sys
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from tqqq.config import DB_PATH, MA_SHORT, MA_LONG
+from tqqq.config import DB_PATH, MA_SHORT, MA_LONG, TICKER
 from tqqq.database import (
     get_connection,
     load_prices,
@@ -20,21 +20,29 @@ from tqqq.database import (
     get_new_signals,
     save_signals,
 )
-from tqqq.signals import detect_crossovers, get_current_status
+from tqqq.signals import detect_crossovers_sql, get_current_status
 from tqqq.notifications import format_signal_message, trigger_all_notifications
 
 
+# Hoisted assertion constants so the checks don't rebuild them per signal
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_EMOJIS = frozenset(("🟢", "🔴"))
+
+
 # Skip integration tests if database doesn't exist or is empty
+@lru_cache(maxsize=1)
 def has_historical_data():
     """Check if we have historical data to test with."""
     if not DB_PATH.exists():
         return False
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
     cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM tqqq_prices")
-    count = cursor.fetchone()[0]
+    # Need at least 30 days for meaningful tests; probing the 30th row
+    # stops the scan there instead of counting the whole table
+    cursor.execute("SELECT 1 FROM tqqq_prices LIMIT 1 OFFSET 29")
+    has_enough = cursor.fetchone() is not None
     conn.close()
-    return count >= 30  # Need at least 30 days for meaningful tests
+    return has_enough
 
 
 requires_historical_data = pytest.mark.skipif(
@@ -43,33 +51,99 @@ requires_historical_data = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="session")
+def db_conn():
+    """One shared connection for the whole integration session.
+
+    Re-opening the database file (and its journal siblings) in every
+    test added a setup/teardown syscall cost per test for no isolation
+    benefit — these tests only read, so the connection is opened in
+    read-only mode with a bigger page cache for the repeated full-table
+    scans.
+    """
+    conn = get_connection(read_only=True)
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def all_signals(db_conn):
+    """Crossover signals detected once for the whole session.
+
+    Uses the SQL fast path: the rolling averages and transition test
+    run inside SQLite as one window-function query, so no price
+    DataFrame is built for the dozen tests that only inspect the
+    resulting list. Equivalence with the pandas detect_crossovers path
+    is covered by unit tests.
+    """
+    return detect_crossovers_sql(db_conn, TICKER)
+
+
+@pytest.fixture(scope="session")
+def prices_df(db_conn):
+    """The full price history loaded once for the whole session.
+
+    Read-only tests share this frame; anything that adds columns or
+    filters must copy first.
+    """
+    return load_prices(db_conn, TICKER)
+
+
+@pytest.fixture(scope="session")
+def signals_df(all_signals):
+    """The detected signals as one DataFrame for vectorized checks."""
+    return pd.DataFrame(all_signals)
+
+
+@pytest.fixture(scope="session")
+def current_status(db_conn):
+    """Current MA status computed once for the whole session."""
+    return get_current_status(db_conn, TICKER)
+
+
+@pytest.fixture(scope="session")
+def sorted_signals(all_signals):
+    """Signals sorted by date once per session.
+
+    itemgetter keeps the comparison key in C; the couple of tests that
+    need chronological order share this list instead of re-sorting.
+    """
+    return sorted(all_signals, key=itemgetter("date"))
+
+
+@pytest.fixture(scope="session")
+def jan_2026_signals(all_signals):
+    """January 2026 signals indexed by date, built once per session."""
+    return {s["date"]: s["signal_type"] for s in all_signals
+            if s["date"].startswith("2026-01")}
+
+
 @requires_historical_data
 class TestDatabaseIntegration:
     """Integration tests for database operations with real data."""
 
-    def test_database_has_sufficient_data(self):
+    def test_database_has_sufficient_data(self, db_conn):
         """Verify database has enough data for MA calculations."""
-        conn = get_connection()
+        conn = db_conn
         count = get_price_count(conn)
-        conn.close()
 
         assert count >= MA_LONG, f"Need at least {MA_LONG} days of data"
 
-    def test_database_date_range_is_reasonable(self):
+    def test_database_date_range_is_reasonable(self, db_conn):
         """Verify date range spans a reasonable period."""
-        conn = get_connection()
-        min_date, max_date = get_date_range(conn)
-        conn.close()
+        conn = db_conn
+        min_date, max_date = get_date_range(conn, TICKER)
 
         assert min_date is not None
         assert max_date is not None
         assert min_date < max_date
 
-    def test_load_prices_returns_valid_data(self):
+    def test_load_prices_returns_valid_data(self, prices_df):
         """Verify loaded prices have valid structure and values."""
-        conn = get_connection()
-        df = load_prices(conn)
-        conn.close()
+        df = prices_df
 
         # Check structure
         assert "date" in df.columns
@@ -78,24 +152,22 @@ class TestDatabaseIntegration:
         # Check data types
         assert df["close"].dtype in ["float64", "int64"]
 
-        # Check values are reasonable for TQQQ (typically $10-$100 range)
-        assert df["close"].min() > 0
-        assert df["close"].max() < 500  # Sanity check
+        # Check values are reasonable for TQQQ (typically $10-$100 range);
+        # reduce over the raw float64 array, skipping pandas' dispatch
+        closes = df["close"].to_numpy(copy=False)
+        assert closes.min() > 0
+        assert closes.max() < 500  # Sanity check
 
-    def test_prices_are_ordered_by_date(self):
+    def test_prices_are_ordered_by_date(self, prices_df):
         """Verify prices are in chronological order."""
-        conn = get_connection()
-        df = load_prices(conn)
-        conn.close()
+        df = prices_df
 
-        dates = df["date"].tolist()
-        assert dates == sorted(dates)
+        # One C-level monotonicity pass instead of sorting a boxed copy
+        assert df["date"].is_monotonic_increasing
 
-    def test_no_duplicate_dates(self):
+    def test_no_duplicate_dates(self, prices_df):
         """Verify no duplicate dates in price data."""
-        conn = get_connection()
-        df = load_prices(conn)
-        conn.close()
+        df = prices_df
 
         assert df["date"].is_unique
 
@@ -104,121 +176,94 @@ class TestDatabaseIntegration:
 class TestSignalDetectionIntegration:
     """Integration tests for crossover signal detection with real data."""
 
-    def test_detect_crossovers_returns_signals(self):
+    def test_detect_crossovers_returns_signals(self, all_signals):
         """Verify crossover detection finds signals in historical data."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
+        signals = all_signals
 
         # Should have found some signals in a year of data
         assert len(signals) > 0
 
-    def test_signals_have_valid_structure(self):
+    def test_signals_have_valid_structure(self, signals_df):
         """Verify detected signals have correct structure."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
-
-        for signal in signals:
-            assert "date" in signal
-            assert "signal_type" in signal
-            assert "close_price" in signal
-            assert "ma5" in signal
-            assert "ma30" in signal
-
-            # Validate signal type
-            assert signal["signal_type"] in ["GOLDEN_CROSS", "DEAD_CROSS"]
-
-            # Validate date format (YYYY-MM-DD)
-            assert len(signal["date"]) == 10
-            assert signal["date"][4] == "-"
-            assert signal["date"][7] == "-"
-
-    def test_signals_have_valid_price_values(self):
+        if signals_df.empty:
+            return
+
+        for field in ("date", "signal_type", "close_price", "ma5", "ma30"):
+            assert field in signals_df.columns
+
+        # Validate signal type
+        assert signals_df["signal_type"].isin(["GOLDEN_CROSS", "DEAD_CROSS"]).all()
+
+        # Validate date format (YYYY-MM-DD)
+        assert signals_df["date"].str.match(_DATE_RE).all()
+
+    def test_signals_have_valid_price_values(self, signals_df):
         """Verify signal price values are reasonable."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
+        if signals_df.empty:
+            return
 
-        for signal in signals:
-            assert signal["close_price"] > 0
-            assert signal["ma5"] > 0
-            assert signal["ma30"] > 0
-            assert signal["close_price"] < 500  # Sanity check
+        assert (signals_df["close_price"] > 0).all()
+        assert (signals_df["ma5"] > 0).all()
+        assert (signals_df["ma30"] > 0).all()
+        assert (signals_df["close_price"] < 500).all()  # Sanity check
 
-    def test_golden_cross_ma5_above_ma30(self):
+    def test_golden_cross_ma5_above_ma30(self, signals_df):
         """Verify golden cross signals have MA5 > MA30."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
+        if signals_df.empty:
+            return
 
-        golden_crosses = [s for s in signals if s["signal_type"] == "GOLDEN_CROSS"]
+        golden = signals_df[signals_df["signal_type"] == "GOLDEN_CROSS"]
+        bad = golden[golden["ma5"] <= golden["ma30"]]
+        assert bad.empty, \
+            f"Golden crosses with MA5 <= MA30 on {bad['date'].tolist()}"
 
-        for signal in golden_crosses:
-            assert signal["ma5"] > signal["ma30"], \
-                f"Golden cross on {signal['date']} has MA5 <= MA30"
-
-    def test_dead_cross_ma5_below_ma30(self):
+    def test_dead_cross_ma5_below_ma30(self, signals_df):
         """Verify dead cross signals have MA5 < MA30."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
-
-        dead_crosses = [s for s in signals if s["signal_type"] == "DEAD_CROSS"]
+        if signals_df.empty:
+            return
 
-        for signal in dead_crosses:
-            assert signal["ma5"] < signal["ma30"], \
-                f"Dead cross on {signal['date']} has MA5 >= MA30"
+        dead = signals_df[signals_df["signal_type"] == "DEAD_CROSS"]
+        bad = dead[dead["ma5"] >= dead["ma30"]]
+        assert bad.empty, \
+            f"Dead crosses with MA5 >= MA30 on {bad['date'].tolist()}"
 
-    def test_signals_alternate_between_types(self):
+    def test_signals_alternate_between_types(self, sorted_signals):
         """Verify signals generally alternate (can't have two golden in a row)."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
-
-        # Sort by date
-        sorted_signals = sorted(signals, key=lambda x: x["date"])
-
-        # Check for consecutive same-type signals (shouldn't happen in theory)
-        for i in range(1, len(sorted_signals)):
-            current = sorted_signals[i]["signal_type"]
-            previous = sorted_signals[i - 1]["signal_type"]
-            # They should alternate
-            assert current != previous, \
-                f"Consecutive {current} signals on {sorted_signals[i-1]['date']} and {sorted_signals[i]['date']}"
-
-    def test_signals_can_be_sorted_by_date(self):
+        # Check for consecutive same-type signals (shouldn't happen in
+        # theory) with one vectorized adjacent compare
+        types = np.array([s["signal_type"] for s in sorted_signals])
+        repeats = types[1:] == types[:-1]
+        if repeats.any():
+            i = int(np.argmax(repeats))
+            pytest.fail(
+                f"Consecutive {types[i + 1]} signals on "
+                f"{sorted_signals[i]['date']} and {sorted_signals[i + 1]['date']}"
+            )
+
+    def test_signals_can_be_sorted_by_date(self, all_signals, sorted_signals):
         """Verify signals can be sorted chronologically."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
-
         # Signals may come grouped by type, but should be sortable
-        sorted_signals = sorted(signals, key=lambda x: x["date"])
-        dates = [s["date"] for s in sorted_signals]
+        dates = np.array([s["date"] for s in sorted_signals])
 
-        # Verify dates are valid and sortable
-        assert dates == sorted(dates)
-        assert len(dates) == len(signals)
+        # Verify the sort produced a monotonic sequence without building
+        # a second sorted copy
+        assert (dates[:-1] <= dates[1:]).all()
+        assert len(dates) == len(all_signals)
 
 
 @requires_historical_data
 class TestCurrentStatusIntegration:
     """Integration tests for current market status with real data."""
 
-    def test_get_current_status_returns_valid_status(self):
+    def test_get_current_status_returns_valid_status(self, current_status):
         """Verify current status is calculated correctly."""
-        conn = get_connection()
-        status = get_current_status(conn)
-        conn.close()
+        status = current_status
 
         assert status["status"] in ["BULLISH", "BEARISH"]
 
-    def test_current_status_has_all_fields(self):
+    def test_current_status_has_all_fields(self, current_status):
         """Verify current status contains all required fields."""
-        conn = get_connection()
-        status = get_current_status(conn)
-        conn.close()
+        status = current_status
 
         assert "date" in status
         assert "status" in status
@@ -227,11 +272,9 @@ class TestCurrentStatusIntegration:
         assert "ma_long" in status
         assert "gap" in status
 
-    def test_current_status_values_are_consistent(self):
+    def test_current_status_values_are_consistent(self, current_status):
         """Verify status is consistent with MA values."""
-        conn = get_connection()
-        status = get_current_status(conn)
-        conn.close()
+        status = current_status
 
         if status["status"] == "BULLISH":
             assert status["ma_short"] > status["ma_long"]
@@ -240,11 +283,9 @@ class TestCurrentStatusIntegration:
             assert status["ma_short"] < status["ma_long"]
             assert status["gap"] < 0
 
-    def test_gap_calculation_is_correct(self):
+    def test_gap_calculation_is_correct(self, current_status):
         """Verify gap is calculated as MA5 - MA20."""
-        conn = get_connection()
-        status = get_current_status(conn)
-        conn.close()
+        status = current_status
 
         expected_gap = status["ma_short"] - status["ma_long"]
         assert abs(status["gap"] - expected_gap) < 0.01
@@ -254,120 +295,105 @@ class TestCurrentStatusIntegration:
 class TestNotificationIntegration:
     """Integration tests for notification formatting with real signals."""
 
-    def test_format_real_signals(self):
-        """Verify notification formatting works with real signals."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
+    @pytest.mark.parametrize("idx", range(5))
+    def test_format_real_signals(self, all_signals, idx):
+        """Verify notification formatting works with real signals.
+
+        Parametrized over the first 5 signals so a failure names the
+        offending case and xdist can spread the cases across workers.
+        """
+        if idx >= len(all_signals):
+            pytest.skip("Fewer than 5 detected signals")
 
-        for signal in signals[:5]:  # Test first 5 signals
-            emoji, signal_name, message = format_signal_message(signal)
+        signal = all_signals[idx]
+        emoji, signal_name, message = format_signal_message(signal)
 
-            assert emoji in ["🟢", "🔴"]
-            assert signal["date"] in message
-            assert "$" in message  # Should have dollar signs for prices
+        assert emoji in _EMOJIS
+        assert signal["date"] in message
+        assert "$" in message  # Should have dollar signs for prices
 
-    def test_trigger_notifications_with_real_signal(self):
+    def test_trigger_notifications_with_real_signal(self, all_signals):
         """Verify notification triggering works with real signals."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
+        signals = all_signals
 
         if signals:
             signal = signals[0]
 
-            # Mock all notification methods to avoid side effects
-            with patch("tqqq.notifications.log_to_console") as mock_console:
-                with patch("tqqq.notifications.log_to_file") as mock_file:
-                    with patch("tqqq.notifications.send_macos_notification") as mock_macos:
-                        with patch("tqqq.notifications.WEBHOOK_URL", ""):
-                            with patch("tqqq.notifications.EMAIL_ENABLED", False):
-                                trigger_all_notifications(signal, "2025-01-15 18:00:00")
+            # Mock all notification methods to avoid side effects; one
+            # patch.multiple installs and unwinds the whole set at once
+            with patch.multiple(
+                "tqqq.notifications",
+                log_to_console=DEFAULT,
+                log_to_file=DEFAULT,
+                send_macos_notification=DEFAULT,
+                WEBHOOK_URL="",
+                EMAIL_ENABLED=False,
+            ) as mocks:
+                trigger_all_notifications(signal, "2025-01-15 18:00:00")
 
-                                mock_console.assert_called_once()
-                                mock_file.assert_called_once()
-                                mock_macos.assert_called_once()
+                mocks["log_to_console"].assert_called_once()
+                mocks["log_to_file"].assert_called_once()
+                mocks["send_macos_notification"].assert_called_once()
 
 
 @requires_historical_data
 class TestEndToEndIntegration:
     """End-to-end integration tests simulating real usage."""
 
-    def test_full_signal_detection_flow(self):
+    def test_full_signal_detection_flow(self, db_conn, all_signals, current_status):
         """Test complete flow: load data -> detect signals -> format notifications."""
-        conn = get_connection()
+        conn = db_conn
 
         # Step 1: Load and verify data
-        df = load_prices(conn)
+        df = load_prices(conn, TICKER)
         assert len(df) >= MA_LONG
 
         # Step 2: Detect signals
-        signals = detect_crossovers(conn)
+        signals = all_signals
         assert len(signals) > 0
 
         # Step 3: Get current status
-        status = get_current_status(conn)
+        status = current_status
         assert status["status"] in ["BULLISH", "BEARISH"]
 
-        # Step 4: Format most recent signal for notification
-        most_recent = sorted(signals, key=lambda x: x["date"])[-1]
+        # Step 4: Format most recent signal for notification; max() finds
+        # it in one pass instead of sorting the whole list
+        most_recent = max(signals, key=itemgetter("date"))
         emoji, signal_name, message = format_signal_message(most_recent)
 
-        assert emoji in ["🟢", "🔴"]
+        assert emoji in _EMOJIS
         assert most_recent["date"] in message
 
-        conn.close()
-
-    def test_new_signal_detection_after_saving(self):
+    def test_new_signal_detection_after_saving(self, db_conn, all_signals):
         """Test that saved signals are not detected as new."""
-        conn = get_connection()
-
-        # Get all signals
-        all_signals = detect_crossovers(conn)
+        conn = db_conn
 
         # Check which would be "new"
-        new_signals = get_new_signals(conn, all_signals)
+        new_signals = get_new_signals(conn, TICKER, all_signals)
 
         # If we've been running the bot, all historical signals should be saved
         # This tests that the signal de-duplication works
         # (new_signals could be empty or contain only recent signals)
 
-        # All new signals should be in the original list
+        # All new signals should be in the original list; one prebuilt
+        # key set turns the per-signal list scans into hash lookups
+        all_keys = {(s["date"], s["signal_type"]) for s in all_signals}
         for new_sig in new_signals:
-            matching = [s for s in all_signals
-                       if s["date"] == new_sig["date"]
-                       and s["signal_type"] == new_sig["signal_type"]]
-            assert len(matching) == 1
-
-        conn.close()
+            assert (new_sig["date"], new_sig["signal_type"]) in all_keys
 
-    def test_january_2026_signals_match_expected(self):
+    def test_january_2026_signals_match_expected(self, jan_2026_signals):
         """Verify specific known signals from January 2026."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
-
-        # Filter to January 2026
-        jan_signals = [s for s in signals if s["date"].startswith("2026-01")]
-
         # Based on MA5/MA30 crossover simulation, we expect these signals:
         expected_dates = ["2026-01-06", "2026-01-09", "2026-01-20"]
 
-        actual_dates = sorted([s["date"] for s in jan_signals])
-
         # Check that we have the expected signals
         for expected in expected_dates:
-            assert expected in actual_dates, f"Missing expected signal on {expected}"
+            assert expected in jan_2026_signals, \
+                f"Missing expected signal on {expected}"
 
-    def test_signal_types_for_january_2026(self):
+    def test_signal_types_for_january_2026(self, jan_2026_signals):
         """Verify signal types for known January 2026 events."""
-        conn = get_connection()
-        signals = detect_crossovers(conn)
-        conn.close()
-
-        # Filter to January 2026
-        jan_signals = {s["date"]: s["signal_type"] for s in signals
-                      if s["date"].startswith("2026-01")}
+        jan_signals = jan_2026_signals
 
         # Expected signal types based on MA5/MA30 simulation
         expected = {
@@ -386,7 +412,7 @@ class TestEndToEndIntegration:
 class TestTradingSimulation:
     """Trading simulation tests using real historical data."""
 
-    def test_trading_simulation_from_jan_2025(self):
+    def test_trading_simulation_from_jan_2025(self, db_conn):
         """Simulate trading strategy: buy at golden cross, sell at dead cross.
 
         Starting capital: $10,000 USD
@@ -403,24 +429,29 @@ class TestTradingSimulation:
         INITIAL_CAPITAL = 10000.00
         START_DATE = "2020-01-01"
 
-        conn = get_connection()
-        df = load_prices(conn)
+        conn = db_conn
+        df = load_prices(conn, TICKER, with_mas=True)
 
-        # Calculate moving averages
-        df["MA_SHORT"] = df["close"].rolling(window=MA_SHORT).mean()
-        df["MA_LONG"] = df["close"].rolling(window=MA_LONG).mean()
-        df = df.dropna()
+        # Use the MA columns cached in the database (one windowed SQL
+        # pass at ingest) instead of re-rolling both windows here
+        df["MA_SHORT"] = df["ma_short"]
+        df["MA_LONG"] = df["ma_long"]
+        df = df.dropna(subset=["MA_SHORT", "MA_LONG"])
 
-        # Filter from start date
-        df = df[df["date"] >= START_DATE].copy()
+        # Filter from start date; the boolean take already yields a new
+        # frame, so no defensive copy on top of it
+        df = df[df["date"] >= START_DATE]
 
         if len(df) == 0:
-            conn.close()
             pytest.skip("No data available from 2025-01-01")
 
-        # Detect crossovers
-        df["short_above"] = df["MA_SHORT"] > df["MA_LONG"]
-        df["prev_short_above"] = df["short_above"].shift(1)
+        # Detect crossovers; only transition days can trade, so find
+        # them once on the raw boolean array instead of walking every
+        # trading day through iterrows
+        sa = (df["MA_SHORT"] > df["MA_LONG"]).to_numpy()
+        prices = df["close"].to_numpy()
+        date_strs = df["date"].dt.strftime("%Y-%m-%d").to_numpy()
+        transitions = np.flatnonzero(sa[1:] != sa[:-1]) + 1
 
         # Trading state
         cash = INITIAL_CAPITAL
@@ -437,18 +468,20 @@ class TestTradingSimulation:
         print(f"Strategy: MA{MA_SHORT}/MA{MA_LONG} Crossover")
         print("=" * 100)
 
+        # %-style args are only substituted when INFO is enabled, so a
+        # quiet run skips the string builds entirely
         logger.info("=" * 80)
         logger.info("TRADING SIMULATION STARTED")
-        logger.info(f"Initial Capital: ${INITIAL_CAPITAL:,.2f}")
-        logger.info(f"Start Date: {START_DATE}")
+        logger.info("Initial Capital: $%.2f", INITIAL_CAPITAL)
+        logger.info("Start Date: %s", START_DATE)
         logger.info("=" * 80)
 
-        for _, row in df.iterrows():
-            date_str = row["date"].strftime("%Y-%m-%d")
-            price = row["close"]
+        for i in transitions:
+            date_str = date_strs[i]
+            price = prices[i]
 
             # Golden Cross - BUY signal
-            if row["short_above"] == True and row["prev_short_above"] == False:
+            if sa[i]:
                 if position == "CASH" and cash > 0:
                     shares = cash / price
                     trade_info = {
@@ -460,12 +493,12 @@ class TestTradingSimulation:
                     }
                     trades.append(trade_info)
                     print(f"🟢 {date_str}: BUY  @ ${price:,.2f} | Shares: {shares:,.4f} | Value: ${cash:,.2f}")
-                    logger.info(f"GOLDEN CROSS - BUY @ ${price:,.2f} | Shares: {shares:,.4f}")
+                    logger.info("GOLDEN CROSS - BUY @ $%.2f | Shares: %.4f", price, shares)
                     cash = 0
                     position = "HOLDING"
 
             # Dead Cross - SELL signal
-            elif row["short_above"] == False and row["prev_short_above"] == True:
+            else:
                 if position == "HOLDING" and shares > 0:
                     sell_value = shares * price
                     profit = sell_value - trades[-1]["value"]
@@ -481,7 +514,8 @@ class TestTradingSimulation:
                     }
                     trades.append(trade_info)
                     print(f"🔴 {date_str}: SELL @ ${price:,.2f} | Shares: {shares:,.4f} | Value: ${sell_value:,.2f} | P/L: ${profit:+,.2f} ({profit_pct:+.2f}%)")
-                    logger.info(f"DEAD CROSS - SELL @ ${price:,.2f} | Value: ${sell_value:,.2f} | P/L: ${profit:+,.2f}")
+                    logger.info("DEAD CROSS - SELL @ $%.2f | Value: $%.2f | P/L: $%+.2f",
+                                price, sell_value, profit)
                     cash = sell_value
                     shares = 0
                     position = "CASH"
@@ -531,19 +565,17 @@ class TestTradingSimulation:
         # Log final results
         logger.info("=" * 80)
         logger.info("SIMULATION COMPLETE")
-        logger.info(f"Final Portfolio Value: ${final_value:,.2f}")
-        logger.info(f"Total Return: ${total_return:+,.2f} ({total_return_pct:+.2f}%)")
-        logger.info(f"Buy & Hold Return: ${buy_hold_return:+,.2f} ({buy_hold_pct:+.2f}%)")
-        logger.info(f"Strategy vs B&H: ${strategy_diff:+,.2f}")
+        logger.info("Final Portfolio Value: $%.2f", final_value)
+        logger.info("Total Return: $%+.2f (%+.2f%%)", total_return, total_return_pct)
+        logger.info("Buy & Hold Return: $%+.2f (%+.2f%%)", buy_hold_return, buy_hold_pct)
+        logger.info("Strategy vs B&H: $%+.2f", strategy_diff)
         logger.info("=" * 80)
 
-        conn.close()
-
         # Assertions
         assert final_value > 0, "Final portfolio value should be positive"
         assert len(trades) >= 0, "Should have detected trades"
 
-    def test_buy_and_hold_simulation(self):
+    def test_buy_and_hold_simulation(self, db_conn):
         """Simulate buy-and-hold strategy for comparison.
 
         Starting capital: $10,000 USD
@@ -558,12 +590,11 @@ class TestTradingSimulation:
         INITIAL_CAPITAL = 10000.00
         START_DATE = "2020-01-01"
 
-        conn = get_connection()
-        df = load_prices(conn)
-        conn.close()
+        conn = db_conn
+        df = load_prices(conn, TICKER)
 
-        # Filter from start date
-        df = df[df["date"] >= START_DATE].copy()
+        # Filter from start date (read-only downstream, no copy needed)
+        df = df[df["date"] >= START_DATE]
 
         if len(df) == 0:
             pytest.skip("No data available from 2020-01-01")
@@ -612,8 +643,8 @@ class TestTradingSimulation:
 
         logger.info("=" * 80)
         logger.info("BUY AND HOLD SIMULATION")
-        logger.info(f"Initial: ${INITIAL_CAPITAL:,.2f} -> Final: ${final_value:,.2f}")
-        logger.info(f"Return: ${total_return:+,.2f} ({total_return_pct:+.2f}%)")
+        logger.info("Initial: $%.2f -> Final: $%.2f", INITIAL_CAPITAL, final_value)
+        logger.info("Return: $%+.2f (%+.2f%%)", total_return, total_return_pct)
         logger.info("=" * 80)
 
         assert final_value > 0, "Final portfolio value should be positive"
@@ -624,41 +655,36 @@ class TestTradingSimulation:
 class TestDataQualityIntegration:
     """Tests for data quality and consistency."""
 
-    def test_no_missing_trading_days(self):
+    def test_no_missing_trading_days(self, prices_df):
         """Check for unusual gaps in trading days."""
-        conn = get_connection()
-        df = load_prices(conn)
-        conn.close()
-
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date")
+        df = prices_df
 
-        # Calculate gaps between consecutive days
-        df["gap"] = df["date"].diff()
+        # load_prices already parses dates and orders by date; diff the
+        # raw datetime64 array instead of allocating a gap column
+        gaps = np.diff(df["date"].to_numpy())
 
         # Most gaps should be 1-3 days (weekends, holidays)
         # Gaps > 5 days are suspicious
-        max_gap = df["gap"].max()
-        assert max_gap.days <= 10, f"Suspicious gap of {max_gap.days} days found"
+        max_gap = gaps.max().astype("timedelta64[D]")
+        assert max_gap <= np.timedelta64(10, "D"), \
+            f"Suspicious gap of {max_gap} found"
 
-    def test_prices_are_positive(self):
+    def test_prices_are_positive(self, prices_df):
         """Verify all prices are positive."""
-        conn = get_connection()
-        df = load_prices(conn)
-        conn.close()
+        df = prices_df
 
         assert (df["close"] > 0).all(), "Found non-positive price values"
 
-    def test_no_extreme_daily_changes(self):
+    def test_no_extreme_daily_changes(self, prices_df):
         """Check for unrealistic daily price changes."""
-        conn = get_connection()
-        df = load_prices(conn)
-        conn.close()
+        df = prices_df
 
-        df = df.sort_values("date")
-        df["pct_change"] = df["close"].pct_change().abs()
+        # Rows arrive date-ordered; one np.diff over the raw close array
+        # replaces the pct_change Series allocation
+        closes = df["close"].to_numpy()
+        rel_changes = np.abs(np.diff(closes) / closes[:-1])
 
         # TQQQ is 3x leveraged, so 30% daily moves are possible but rare
         # 50%+ would be extremely unusual
-        max_change = df["pct_change"].max()
+        max_change = rel_changes.max()
         assert max_change < 0.5, f"Suspicious daily change of {max_change:.1%}"
@@ -8,11 +8,8 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-# Add parent directory to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from scripts.migrate_multi_ticker import (
+    backup_database,
     check_migration_needed,
     perform_migration,
     rollback_migration,
@@ -227,11 +224,11 @@ class TestPerformMigration:
         signal_tickers = [row[0] for row in cursor.fetchall()]
         assert signal_tickers == ["TQQQ"]
 
-    def test_migration_creates_backup_tables(self, old_schema_db):
-        """Test that migration creates backup tables."""
+    def test_keep_backup_retains_backup_tables(self, old_schema_db):
+        """Test that keep_backup=True retains the backup tables."""
         conn, _ = old_schema_db
 
-        perform_migration(conn, dry_run=False, log_file=None)
+        perform_migration(conn, dry_run=False, log_file=None, keep_backup=True)
 
         # Verify backup tables exist
         cursor = conn.cursor()
@@ -241,6 +238,30 @@ class TestPerformMigration:
         assert "tqqq_prices_backup" in tables
         assert "crossover_signals_backup" in tables
 
+    def test_backup_tables_dropped_by_default(self, old_schema_db):
+        """Test that backup tables are dropped unless keep_backup is set."""
+        conn, _ = old_schema_db
+
+        perform_migration(conn, dry_run=False, log_file=None)
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = {row[0] for row in cursor.fetchall()}
+
+        assert "tqqq_prices_backup" not in tables
+        assert "crossover_signals_backup" not in tables
+
+    def test_migration_creates_signals_index(self, old_schema_db):
+        """Test that migration creates the (ticker, date) signals index."""
+        conn, _ = old_schema_db
+
+        perform_migration(conn, dry_run=False, log_file=None)
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        indexes = {row[0] for row in cursor.fetchall()}
+        assert "idx_signals_ticker_date" in indexes
+
     def test_dry_run_doesnt_modify(self, old_schema_db):
         """Test that dry-run mode doesn't modify the database."""
         conn, _ = old_schema_db
@@ -287,8 +308,8 @@ class TestRollbackMigration:
         """Test that rollback restores the original schema."""
         conn, _ = old_schema_db
 
-        # Perform migration
-        perform_migration(conn, dry_run=False, log_file=None)
+        # Perform migration, keeping the backup tables for the rollback
+        perform_migration(conn, dry_run=False, log_file=None, keep_backup=True)
 
         # Verify new schema
         cursor = conn.cursor()
@@ -323,8 +344,8 @@ class TestRollbackMigration:
         cursor.execute("SELECT COUNT(*) FROM tqqq_prices")
         original_count = cursor.fetchone()[0]
 
-        # Perform migration
-        perform_migration(conn, dry_run=False, log_file=None)
+        # Perform migration, keeping the backup tables for the rollback
+        perform_migration(conn, dry_run=False, log_file=None, keep_backup=True)
 
         # Rollback
         rollback_migration(conn, log_file=None)
@@ -335,6 +356,27 @@ class TestRollbackMigration:
         assert final_count == original_count
 
 
+class TestBackupDatabase:
+    """Tests for backup_database function."""
+
+    def test_backup_contains_all_data(self, old_schema_db):
+        """Test that the backup is a complete copy of the database."""
+        conn, path = old_schema_db
+        backup_path = backup_database(Path(path))
+
+        try:
+            backup_conn = sqlite3.connect(str(backup_path))
+            cursor = backup_conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM tqqq_prices")
+            assert cursor.fetchone()[0] == 10
+            cursor.execute("SELECT COUNT(*) FROM crossover_signals")
+            assert cursor.fetchone()[0] == 1
+            backup_conn.close()
+        finally:
+            if backup_path.exists():
+                os.unlink(backup_path)
+
+
 class TestMigrationEdgeCases:
     """Tests for edge cases in migration."""
 
@@ -6,7 +6,12 @@ import pandas as pd
 import pytest
 
 from tqqq.database import save_prices
-from tqqq.signals import detect_crossovers, get_current_status
+from tqqq.signals import (
+    detect_crossovers,
+    detect_crossovers_sql,
+    get_current_status,
+    get_current_status_bulk,
+)
 
 
 class TestDetectCrossovers:
@@ -127,6 +132,81 @@ class TestDetectCrossovers:
         assert signals == []
 
 
+class TestDetectCrossoversSinceDate:
+    """Tests for the since_date filter of detect_crossovers."""
+
+    def test_filters_signals_up_to_since_date(self, temp_db, sample_price_data_with_crossover):
+        """Test that signals on or before since_date are excluded."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data_with_crossover)
+
+        all_signals = detect_crossovers(conn, "TQQQ")
+        assert len(all_signals) >= 1
+
+        last_date = max(s["date"] for s in all_signals)
+        remaining = detect_crossovers(conn, "TQQQ", since_date=last_date)
+        assert remaining == []
+
+    def test_earlier_since_date_keeps_signals(self, temp_db, sample_price_data_with_crossover):
+        """Test that an old since_date returns the same signals."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data_with_crossover)
+
+        all_signals = detect_crossovers(conn, "TQQQ")
+        filtered = detect_crossovers(conn, "TQQQ", since_date="2024-12-31")
+        assert filtered == all_signals
+
+
+class TestDetectCrossoversSql:
+    """Tests for the SQL-side crossover detection fast path."""
+
+    def test_matches_pandas_detection(self, temp_db, sample_price_data_with_crossover):
+        """Test that the SQL path finds the same signals as detect_crossovers."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data_with_crossover)
+
+        expected = detect_crossovers(conn, "TQQQ")
+        actual = detect_crossovers_sql(conn, "TQQQ")
+
+        assert len(actual) == len(expected) >= 1
+        for got, want in zip(actual, sorted(expected, key=lambda s: s["date"])):
+            assert got["date"] == want["date"]
+            assert got["signal_type"] == want["signal_type"]
+            assert got["close_price"] == pytest.approx(want["close_price"])
+            assert got["ma5"] == pytest.approx(want["ma5"])
+            assert got["ma30"] == pytest.approx(want["ma30"])
+
+    def test_returns_empty_for_insufficient_data(self, temp_db):
+        """Test returns empty list when not enough data."""
+        conn, _ = temp_db
+
+        dates = pd.date_range(start="2025-01-01", periods=10, freq="B")
+        df = pd.DataFrame(
+            {
+                "Open": [50] * 10,
+                "High": [51] * 10,
+                "Low": [49] * 10,
+                "Close": [50] * 10,
+                "Volume": [1000000] * 10,
+            },
+            index=dates,
+        )
+        save_prices(conn, "TQQQ", df)
+
+        assert detect_crossovers_sql(conn, "TQQQ") == []
+
+    def test_since_date_filters_signals(self, temp_db, sample_price_data_with_crossover):
+        """Test that since_date excludes signals on or before it."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data_with_crossover)
+
+        all_signals = detect_crossovers_sql(conn, "TQQQ")
+        assert len(all_signals) >= 1
+
+        last_date = max(s["date"] for s in all_signals)
+        assert detect_crossovers_sql(conn, "TQQQ", since_date=last_date) == []
+
+
 class TestGetCurrentStatus:
     """Tests for get_current_status function."""
 
@@ -226,3 +306,40 @@ class TestGetCurrentStatus:
 
         expected_gap = status["ma_short"] - status["ma_long"]
         assert abs(status["gap"] - expected_gap) < 0.01
+
+
+class TestGetCurrentStatusBulk:
+    """Tests for get_current_status_bulk function."""
+
+    def test_empty_ticker_list(self, temp_db):
+        """Test returns empty dict for empty ticker list."""
+        conn, _ = temp_db
+        assert get_current_status_bulk(conn, []) == {}
+
+    def test_matches_single_ticker_status(self, temp_db, sample_price_data):
+        """Test bulk results match per-ticker get_current_status."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data)
+
+        yinn_data = sample_price_data.copy()
+        yinn_data["Close"] = yinn_data["Close"] + 100
+        save_prices(conn, "YINN", yinn_data)
+
+        bulk = get_current_status_bulk(conn, ["TQQQ", "YINN"])
+
+        for ticker in ("TQQQ", "YINN"):
+            single = get_current_status(conn, ticker)
+            assert bulk[ticker]["status"] == single["status"]
+            assert bulk[ticker]["date"] == single["date"]
+            assert abs(bulk[ticker]["ma_short"] - single["ma_short"]) < 0.01
+            assert abs(bulk[ticker]["ma_long"] - single["ma_long"]) < 0.01
+
+    def test_missing_ticker_reports_insufficient_data(self, temp_db, sample_price_data):
+        """Test tickers without data report INSUFFICIENT_DATA."""
+        conn, _ = temp_db
+        save_prices(conn, "TQQQ", sample_price_data)
+
+        bulk = get_current_status_bulk(conn, ["TQQQ", "YINN"])
+
+        assert bulk["TQQQ"]["status"] in ["BULLISH", "BEARISH"]
+        assert bulk["YINN"]["status"] == "INSUFFICIENT_DATA"
@@ -23,29 +23,48 @@ CRON_LOG_PATH = LOGS_DIR / "cron.log"
 MA_SHORT = 5
 MA_LONG = 30
 
-# Webhook (Slack/Discord)
-WEBHOOK_URL = os.environ.get("TQQQ_WEBHOOK_URL", "")
-
-# Email configuration (Gmail)
-EMAIL_ENABLED = os.environ.get("TQQQ_EMAIL_ENABLED", "false").lower() == "true"
-EMAIL_SENDER = os.environ.get("TQQQ_EMAIL_SENDER", "")
-EMAIL_PASSWORD = os.environ.get("TQQQ_EMAIL_PASSWORD", "")
-# Support comma-separated list; fall back to singular TQQQ_EMAIL_RECIPIENT
-_recipients_raw = os.environ.get(
-    "TQQQ_EMAIL_RECIPIENTS",
-    os.environ.get("TQQQ_EMAIL_RECIPIENT", ""),
-)
-EMAIL_RECIPIENTS = [r.strip() for r in _recipients_raw.split(",") if r.strip()]
-# Keep backward compat for any code referencing the singular form
-EMAIL_RECIPIENT = EMAIL_RECIPIENTS[0] if EMAIL_RECIPIENTS else ""
 SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
 
-# Stock settings
-# Support multiple tickers via environment variable (comma-separated)
-TICKERS = os.environ.get("TQQQ_TICKERS", "TQQQ").split(",")
-TICKERS = [t.strip().upper() for t in TICKERS if t.strip()]
-
-# Keep for backward compatibility
-TICKER = TICKERS[0] if TICKERS else "TQQQ"
 HISTORY_DAYS = 365
+
+
+def _refresh():
+    """Re-read environment-driven settings into the module globals.
+
+    Much cheaper than importlib.reload for tests: it only touches
+    os.environ, without re-resolving paths or re-running mkdir.
+    """
+    global WEBHOOK_URL, EMAIL_ENABLED, EMAIL_SENDER, EMAIL_PASSWORD
+    global EMAIL_RECIPIENTS, EMAIL_RECIPIENT, TICKERS, TICKER
+
+    # Webhook (Slack/Discord)
+    WEBHOOK_URL = os.environ.get("TQQQ_WEBHOOK_URL", "")
+
+    # Email configuration (Gmail)
+    EMAIL_ENABLED = os.environ.get("TQQQ_EMAIL_ENABLED", "false").lower() == "true"
+    EMAIL_SENDER = os.environ.get("TQQQ_EMAIL_SENDER", "")
+    EMAIL_PASSWORD = os.environ.get("TQQQ_EMAIL_PASSWORD", "")
+    # Support comma-separated list; fall back to singular TQQQ_EMAIL_RECIPIENT
+    recipients_raw = os.environ.get(
+        "TQQQ_EMAIL_RECIPIENTS",
+        os.environ.get("TQQQ_EMAIL_RECIPIENT", ""),
+    )
+    EMAIL_RECIPIENTS = [r.strip() for r in recipients_raw.split(",") if r.strip()]
+    # Keep backward compat for any code referencing the singular form
+    EMAIL_RECIPIENT = EMAIL_RECIPIENTS[0] if EMAIL_RECIPIENTS else ""
+
+    # Stock settings
+    # Support multiple tickers via environment variable (comma-separated)
+    TICKERS = os.environ.get("TQQQ_TICKERS", "TQQQ").split(",")
+    TICKERS = [t.strip().upper() for t in TICKERS if t.strip()]
+    if not TICKERS:
+        # An empty/blank TQQQ_TICKERS would leave every script with
+        # nothing to process; fall back to the historical default
+        TICKERS = ["TQQQ"]
+
+    # Keep for backward compatibility
+    TICKER = TICKERS[0]
+
+
+_refresh()
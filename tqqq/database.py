@@ -2,16 +2,36 @@
 
 import sqlite3
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, List, Dict
 
 import pandas as pd
 
-from .config import DB_PATH
+from .config import DB_PATH, MA_SHORT, MA_LONG
 
 
-def get_connection() -> sqlite3.Connection:
-    """Get database connection and ensure tables exist."""
-    conn = sqlite3.connect(str(DB_PATH))
+def get_connection(db_path=None, read_only: bool = False) -> sqlite3.Connection:
+    """Get database connection and ensure tables exist.
+
+    db_path overrides the configured DB_PATH (e.g. ":memory:" in tests,
+    which skips file and journal I/O entirely). Pass read_only=True for
+    report-style scripts: the file is opened in mode=ro with query_only
+    set, so SQLite skips journal setup and never upgrades to a write
+    lock.
+    """
+    path = DB_PATH if db_path is None else db_path
+
+    if read_only and path != ":memory:" and Path(str(path)).exists():
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    conn = sqlite3.connect(str(path))
+    # Rows come back as C-level sqlite3.Row structs: indexable like the
+    # tuples callers already expect, plus named access, without a Python
+    # tuple allocation per row
+    conn.row_factory = sqlite3.Row
     _create_tables(conn)
     return conn
 
@@ -30,10 +50,19 @@ def _create_tables(conn: sqlite3.Connection) -> None:
             close REAL,
             adj_close REAL,
             volume INTEGER,
+            ma_short REAL,
+            ma_long REAL,
             PRIMARY KEY (ticker, date)
         )
     """)
 
+    # Upgrade databases created before the cached MA columns existed
+    cursor.execute("PRAGMA table_info(tqqq_prices)")
+    columns = {col[1] for col in cursor.fetchall()}
+    if "ma_short" not in columns:
+        cursor.execute("ALTER TABLE tqqq_prices ADD COLUMN ma_short REAL")
+        cursor.execute("ALTER TABLE tqqq_prices ADD COLUMN ma_long REAL")
+
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS crossover_signals (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -48,6 +77,21 @@ def _create_tables(conn: sqlite3.Connection) -> None:
         )
     """)
 
+    # Serves "latest signals per ticker" queries (WHERE ticker = ?
+    # ORDER BY date DESC LIMIT n) as a range scan with no sort step
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_signals_ticker_date
+        ON crossover_signals(ticker, date DESC)
+    """)
+
+    # Covers the (date, signal_type) probes in get_new_signals so dedup
+    # stays an index-only lookup as the signal history grows. Not UNIQUE:
+    # the same date/type pair can exist for different tickers.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sig_date_type
+        ON crossover_signals(date, signal_type)
+    """)
+
     conn.commit()
 
 
@@ -59,84 +103,160 @@ def get_last_date(conn: sqlite3.Connection, ticker: str) -> Optional[str]:
     return result
 
 
-def save_prices(conn: sqlite3.Connection, ticker: str, df: pd.DataFrame) -> int:
-    """Save price data to database for a specific ticker."""
+def get_last_signal_date(conn: sqlite3.Connection, ticker: str) -> Optional[str]:
+    """Get the date of the most recent saved signal for a specific ticker."""
     cursor = conn.cursor()
-    rows_inserted = 0
-
-    for date, row in df.iterrows():
-        date_str = date.strftime("%Y-%m-%d")
-        cursor.execute("""
-            INSERT OR REPLACE INTO tqqq_prices
-            (ticker, date, open, high, low, close, adj_close, volume)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            ticker,
-            date_str,
-            row["Open"],
-            row["High"],
-            row["Low"],
-            row["Close"],
-            row.get("Adj Close", row["Close"]),
-            int(row["Volume"])
-        ))
-        rows_inserted += 1
+    cursor.execute("SELECT MAX(date) FROM crossover_signals WHERE ticker = ?", (ticker,))
+    return cursor.fetchone()[0]
 
-    conn.commit()
-    return rows_inserted
 
+def save_prices(conn: sqlite3.Connection, ticker: str, df: pd.DataFrame,
+                commit: bool = True) -> int:
+    """Save price data to database for a specific ticker.
+
+    Pass commit=False to let the caller batch several writes into one
+    transaction and commit once.
+    """
+    # Extract whole columns and bind them with one executemany; the row
+    # loop runs inside sqlite3's C layer instead of iterrows
+    adj_close = df["Adj Close"] if "Adj Close" in df.columns else df["Close"]
+    rows = list(zip(
+        [ticker] * len(df),
+        df.index.strftime("%Y-%m-%d").tolist(),
+        df["Open"].astype(float).tolist(),
+        df["High"].astype(float).tolist(),
+        df["Low"].astype(float).tolist(),
+        df["Close"].astype(float).tolist(),
+        adj_close.astype(float).tolist(),
+        df["Volume"].astype(int).tolist(),
+    ))
+
+    conn.executemany("""
+        INSERT OR REPLACE INTO tqqq_prices
+        (ticker, date, open, high, low, close, adj_close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+
+    if rows:
+        refresh_moving_averages(conn, ticker, commit=False)
+
+    if commit:
+        conn.commit()
+    return len(rows)
+
+
+def refresh_moving_averages(conn: sqlite3.Connection, ticker: str,
+                            commit: bool = True) -> None:
+    """Recompute the cached ma_short/ma_long columns for a ticker.
+
+    The rolling means are stored with the prices so CLI scripts can read
+    precomputed values instead of re-running the windows on every
+    invocation. Rows without enough history keep NULL, matching pandas
+    rolling(min_periods=window) semantics.
+    """
+    conn.execute(f"""
+        WITH windowed AS (
+            SELECT date,
+                   AVG(close) OVER win_short AS ma_short,
+                   AVG(close) OVER win_long AS ma_long,
+                   ROW_NUMBER() OVER (ORDER BY date) AS rn
+            FROM tqqq_prices
+            WHERE ticker = ?
+            WINDOW win_short AS (ORDER BY date ROWS {MA_SHORT - 1} PRECEDING),
+                   win_long AS (ORDER BY date ROWS {MA_LONG - 1} PRECEDING)
+        )
+        UPDATE tqqq_prices AS p
+        SET ma_short = CASE WHEN w.rn >= {MA_SHORT} THEN w.ma_short END,
+            ma_long = CASE WHEN w.rn >= {MA_LONG} THEN w.ma_long END
+        FROM windowed AS w
+        WHERE p.ticker = ? AND p.date = w.date
+    """, (ticker, ticker))
+    if commit:
+        conn.commit()
+
+
+def load_prices(conn: sqlite3.Connection, ticker: str,
+                with_mas: bool = False) -> pd.DataFrame:
+    """Load all price data from database for a specific ticker.
+
+    Pass with_mas=True to also load the cached ma_short/ma_long columns.
+    """
+    if with_mas:
+        query = ("SELECT date, close, ma_short, ma_long FROM tqqq_prices "
+                 "WHERE ticker = ? ORDER BY date")
+        dtype = {"close": "float64", "ma_short": "float64", "ma_long": "float64"}
+    else:
+        query = "SELECT date, close FROM tqqq_prices WHERE ticker = ? ORDER BY date"
+        dtype = {"close": "float64"}
 
-def load_prices(conn: sqlite3.Connection, ticker: str) -> pd.DataFrame:
-    """Load all price data from database for a specific ticker."""
+    # Declaring the dtypes up front skips pandas' inference pass and the
+    # extra to_numeric copy this used to make
     df = pd.read_sql_query(
-        "SELECT date, close FROM tqqq_prices WHERE ticker = ? ORDER BY date",
+        query,
         conn,
         params=(ticker,),
-        parse_dates=["date"]
+        parse_dates=["date"],
+        dtype=dtype,
     )
-    # Ensure close is numeric
-    if len(df) > 0:
-        df["close"] = pd.to_numeric(df["close"], errors="coerce")
+
+    if with_mas and len(df) > 0 and df["ma_long"].isna().all():
+        # Cache never populated (rows predate the MA columns); compute
+        # the windows on the fly as before
+        df["ma_short"] = df["close"].rolling(window=MA_SHORT).mean()
+        df["ma_long"] = df["close"].rolling(window=MA_LONG).mean()
+
     return df
 
 
 def get_new_signals(conn: sqlite3.Connection, ticker: str, signals: List[Dict]) -> List[Dict]:
     """Filter out signals that have already been recorded for a specific ticker."""
-    cursor = conn.cursor()
-    new_signals = []
+    if not signals:
+        return []
 
+    # One row-value membership query instead of a SELECT per candidate,
+    # then a hash-set filter in Python
+    placeholders = ",".join(["(?,?)"] * len(signals))
+    params = [ticker]
     for signal in signals:
-        cursor.execute(
-            "SELECT 1 FROM crossover_signals WHERE ticker = ? AND date = ? AND signal_type = ?",
-            (ticker, signal["date"], signal["signal_type"])
-        )
-        if cursor.fetchone() is None:
-            new_signals.append(signal)
-
-    return new_signals
+        params.extend((signal["date"], signal["signal_type"]))
 
-
-def save_signals(conn: sqlite3.Connection, ticker: str, signals: List[Dict]) -> int:
-    """Save new signals to the database for a specific ticker."""
     cursor = conn.cursor()
-    saved = 0
-
-    for signal in signals:
-        cursor.execute("""
-            INSERT OR IGNORE INTO crossover_signals
-            (ticker, date, signal_type, close_price, ma5, ma30)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            ticker,
-            signal["date"],
-            signal["signal_type"],
-            signal["close_price"],
-            signal["ma5"],
-            signal["ma30"]
-        ))
-        saved += cursor.rowcount
-
-    conn.commit()
+    cursor.execute(f"""
+        SELECT date, signal_type FROM crossover_signals
+        WHERE ticker = ? AND (date, signal_type) IN (VALUES {placeholders})
+    """, params)
+    # Build tuples explicitly: sqlite3.Row doesn't hash/compare like the
+    # (date, signal_type) tuples probed below
+    existing = {(row[0], row[1]) for row in cursor.fetchall()}
+
+    return [s for s in signals if (s["date"], s["signal_type"]) not in existing]
+
+
+def save_signals(conn: sqlite3.Connection, ticker: str, signals: List[Dict],
+                 commit: bool = True) -> int:
+    """Save new signals to the database for a specific ticker.
+
+    Pass commit=False to let the caller batch several writes into one
+    transaction and commit once.
+    """
+    if not signals:
+        return 0
+
+    # One prepared statement for the whole batch; rowcount accumulates
+    # only the rows actually inserted, so ignored duplicates don't count
+    rows = [
+        (ticker, s["date"], s["signal_type"], s["close_price"], s["ma5"], s["ma30"])
+        for s in signals
+    ]
+    cursor = conn.executemany("""
+        INSERT OR IGNORE INTO crossover_signals
+        (ticker, date, signal_type, close_price, ma5, ma30)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, rows)
+    saved = cursor.rowcount
+
+    if commit:
+        conn.commit()
     return saved
 
 
